@@ -1,96 +1,156 @@
-from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from roadmapper.painter import Painter
+if TYPE_CHECKING:
+    from roadmapper.painter import Painter
 
 
-@dataclass
 class Header:
     """Header section that can display a logo alongside title and subtitle text."""
 
-    title: str
-    subtitle: Optional[str] = None
-    logo_path: Optional[str] = None
-    logo_width: int = 80
-    logo_height: int = 80
-    padding_x: int = 24
-    padding_y: int = 18
-    logo_spacing: int = 16
-    background_colour: Optional[str] = "#FFFFFF"
-    divider_colour: Optional[str] = "#CCCCCC"
-
-    _measured_height: float = field(default=0, init=False)
-    _subtitle_font_size: int = field(default=0, init=False)
-
-    def _measure(self, painter: Painter) -> float:
-        """Measure the vertical height required for the header."""
-        painter.set_font(
-            painter.title_font, painter.title_font_size, painter.title_font_colour
+    __slots__ = (
+        "title",
+        "subtitle",
+        "logo_path",
+        "logo_width",
+        "logo_height",
+        "padding_x",
+        "padding_y",
+        "logo_spacing",
+        "background_colour",
+        "divider_colour",
+        "_measured_height",
+        "_content_height",
+        "_text_runs",
+        "_layout_cache_key",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        subtitle: Optional[str] = None,
+        logo_path: Optional[str] = None,
+        logo_width: int = 80,
+        logo_height: int = 80,
+        padding_x: int = 24,
+        padding_y: int = 18,
+        logo_spacing: int = 16,
+        background_colour: Optional[str] = "#FFFFFF",
+        divider_colour: Optional[str] = "#CCCCCC",
+    ) -> None:
+        self.title = title
+        self.subtitle = subtitle
+        self.logo_path = logo_path
+        self.logo_width = logo_width
+        self.logo_height = logo_height
+        self.padding_x = padding_x
+        self.padding_y = padding_y
+        self.logo_spacing = logo_spacing
+        self.background_colour = background_colour
+        self.divider_colour = divider_colour
+
+        self._measured_height: float = 0
+        self._content_height: float = 0
+        # (font, font_size, font_colour, baseline, text) for each line of text,
+        # recorded while measuring so draw() can replay them without re-measuring
+        self._text_runs: list = []
+        self._layout_cache_key: Optional[tuple] = None
+
+    def _layout_key(self, painter: "Painter") -> tuple:
+        """Inputs that determine the measured header layout."""
+        return (
+            self.title,
+            self.subtitle,
+            painter.title_font,
+            painter.font_generation,
+            painter.title_font_size,
+            painter.title_font_colour,
+            painter.timeline_font_colour,
+            self.logo_height,
+            self.padding_y,
         )
+
+    def _measure(self, painter: "Painter", layout_key: tuple) -> float:
+        """Measure the vertical height required for the header."""
+        title_font = painter.title_font
+        title_font_size = painter.title_font_size
+        title_font_colour = painter.title_font_colour
+        subtitle_font_colour = painter.timeline_font_colour
+
+        # Baselines are stored as ints, ready for the painter
+        title_baseline = int(self.padding_y + title_font_size)
+        painter.set_font(title_font, title_font_size, title_font_colour)
         _, title_height = painter.get_text_dimension(self.title or "")
+        text_runs = [
+            (title_font, title_font_size, title_font_colour, title_baseline, self.title)
+        ]
 
         subtitle_height = 0
         if self.subtitle:
-            subtitle_font_size = max(painter.title_font_size - 4, 10)
-            painter.set_font(
-                painter.title_font, subtitle_font_size, painter.timeline_font_colour
-            )
+            subtitle_font_size = max(title_font_size - 4, 10)
+            painter.set_font(title_font, subtitle_font_size, subtitle_font_colour)
             _, subtitle_height = painter.get_text_dimension(self.subtitle)
-            self._subtitle_font_size = subtitle_font_size
-        else:
-            self._subtitle_font_size = 0
+            text_runs.append(
+                (
+                    title_font,
+                    subtitle_font_size,
+                    subtitle_font_colour,
+                    int(title_baseline + subtitle_font_size + 4),
+                    self.subtitle,
+                )
+            )
 
         text_block_height = title_height + (subtitle_height + 6 if self.subtitle else 0)
         content_height = max(self.logo_height, text_block_height)
+        self._content_height = content_height
         self._measured_height = content_height + (self.padding_y * 2)
+        self._text_runs = text_runs
+        self._layout_cache_key = layout_key
         return self._measured_height
 
-    def draw(self, painter: Painter) -> None:
+    def draw(self, painter: "Painter") -> None:
         """Draw the header onto the canvas."""
-        header_height = self._measure(painter)
-        content_height = header_height - (self.padding_y * 2)
+        header_height = self.measure(painter)
+        content_height = self._content_height
+        set_colour = painter.set_colour
+        canvas_width = painter.width
 
         if self.background_colour:
-            painter.set_colour(self.background_colour)
-            painter.draw_box(0, 0, painter.width, header_height)
+            set_colour(self.background_colour)
+            painter.draw_box(0, 0, canvas_width, header_height)
 
         content_x = float(self.padding_x)
         if self.logo_path:
-            logo_y = self.padding_y + max(
-                (content_height - self.logo_height) / 2.0, 0.0
-            )
+            # content_height is never smaller than logo_height (see _measure)
+            logo_y = self.padding_y + (content_height - self.logo_height) * 0.5
             painter.draw_image(
                 self.logo_path, content_x, logo_y, self.logo_width, self.logo_height
             )
             content_x += self.logo_width + self.logo_spacing
 
-        title_baseline = self.padding_y + painter.title_font_size
-        painter.set_font(
-            painter.title_font, painter.title_font_size, painter.title_font_colour
-        )
-        painter.draw_text(int(content_x), int(title_baseline), self.title)
-
-        if self.subtitle:
-            subtitle_baseline = (
-                title_baseline + self._subtitle_font_size + 4
-            )
-            painter.set_font(
-                painter.title_font,
-                self._subtitle_font_size,
-                painter.timeline_font_colour,
-            )
-            painter.draw_text(int(content_x), int(subtitle_baseline), self.subtitle)
+        set_font = painter.set_font
+        draw_text = painter.draw_text
+        text_x = int(content_x)
+        for font, font_size, font_colour, baseline, text in self._text_runs:
+            set_font(font, font_size, font_colour)
+            draw_text(text_x, baseline, text)
 
         if self.divider_colour:
-            painter.set_colour(self.divider_colour)
+            set_colour(self.divider_colour)
             painter.set_line_width(1)
-            painter.draw_line(0, header_height, painter.width, header_height)
+            painter.draw_line(0, header_height, canvas_width, header_height)
 
         painter.last_drawn_y_pos = header_height
 
-    def measure(self, painter: Painter) -> float:
-        """Public helper to measure height without drawing."""
-        return self._measure(painter)
+    def measure(self, painter: "Painter") -> float:
+        """Public helper to measure height without drawing.
+
+        The height is remembered until the header text, logo height, padding,
+        the painter's title styling or its registered fonts change.
+        """
+        layout_key = self._layout_key(painter)
+        if self._measured_height and self._layout_cache_key == layout_key:
+            return self._measured_height
+        return self._measure(painter, layout_key)
 
     @property
     def height(self) -> float:
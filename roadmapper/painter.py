@@ -106,6 +106,13 @@ class Painter:
 
         self.__cr = cairo.Context(self.__surface)
         self._registered_fonts: Dict[str, str] = {}
+        # (font, font_size) currently selected on the context
+        self._font_state: Optional[tuple] = None
+        # {(font, font_size): {text: (text_width, text_height)}}
+        self._text_dimension_cache: Dict[tuple, Dict[str, tuple]] = {}
+        # Bumped whenever a font is (re-)registered, so callers that cache
+        # measurements can tell when they are stale
+        self.font_generation = 0
 
     def set_colour_palette(self, colour_palette: str) -> None:
         """Set colour palette
@@ -182,8 +189,13 @@ class Painter:
             font_size (int): Font size
             font_colour (str): Font colour in HTML colour name or hex code. Eg. #FFFFFF or LightGreen
         """
-        self.__cr.select_font_face(font)
-        self.__cr.set_font_size(font_size)
+        # Selecting a font face is comparatively expensive, so only do it when
+        # the face or size actually changes. The colour is always applied as
+        # set_colour() may have been called in between.
+        if self._font_state != (font, font_size):
+            self.__cr.select_font_face(font)
+            self.__cr.set_font_size(font_size)
+            self._font_state = (font, font_size)
         self.set_colour(font_colour)
 
     def draw_box(self, x: int, y: int, width: int, height: int) -> None:
@@ -328,21 +340,29 @@ class Painter:
     def get_text_dimension(self, text: str) -> tuple:
         """Get text dimension
 
+        Results are cached per selected (font, font_size).
+
         Args:
             text (str): Text that is used to calculate dimension
 
         Returns:
             (text_width (int), text_height (int)): Text dimension (width, height)
         """
-        (
-            _,
-            _,
-            text_width,
-            text_height,
-            _,
-            _,
-        ) = self.__cr.text_extents(text)
-        return text_width, text_height
+        font_cache = self._text_dimension_cache.get(self._font_state)
+        if font_cache is None:
+            font_cache = self._text_dimension_cache[self._font_state] = {}
+        dimension = font_cache.get(text)
+        if dimension is None:
+            (
+                _,
+                _,
+                text_width,
+                text_height,
+                _,
+                _,
+            ) = self.__cr.text_extents(text)
+            dimension = font_cache[text] = (text_width, text_height)
+        return dimension
 
     def set_background_colour(self) -> None:
         """Set surface background colour
@@ -401,6 +421,11 @@ class Painter:
             except Exception as exc2:  # pragma: no cover - platform specifics
                 raise RuntimeError(f"Failed to register font '{font_name}': {exc2}")
         self._registered_fonts[font_name] = path
+        # The font name may now resolve to a different face, so measurements
+        # and the face currently selected on the context are both stale
+        self._text_dimension_cache.clear()
+        self._font_state = None
+        self.font_generation += 1
 
     def _register_font_with_platform(self, path: str) -> None:
         if sys.platform == "darwin":
@@ -21,11 +21,13 @@
 # SOFTWARE.
 
 import os
+import sys
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, field
 from contextlib import contextmanager
-from typing import Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Optional, Union
 
 from roadmapper.painter import Painter
 from roadmapper.title import Title, Subtitle
@@ -35,32 +37,114 @@ from roadmapper.timeline import Timeline
 from roadmapper.group import Group
 from roadmapper.marker import Marker
 from roadmapper.header import Header
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.rl_accel import fp_str
+    from reportlab.lib.utils import simpleSplit
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.pdfgen import canvas
+    from reportlab.pdfgen.canvas import FILL_NON_ZERO
+except ImportError:  # pragma: no cover - reportlab is only needed for PDF export
+    colors = None
+    _REPORTLAB_AVAILABLE = False
+else:
+    _REPORTLAB_AVAILABLE = True
+
+# Task.has_detail is a property on every task, so no hasattr() probe is needed
+_has_detail = attrgetter("has_detail")
+
+# Tree prefixes used by Roadmap.print_roadmap
+_PRINT_BRANCH = "└" + "─" * 8
+_PRINT_MILESTONE = " " * 9 + "├" + "─" * 4
+_PRINT_PARALLEL = " " * 9 + "└" + "─" * 4
+_PRINT_PARALLEL_MILESTONE = " " * 14 + "├" + "─" * 4
+
+# (font name, font file) -> font name usable on a PDF canvas. ReportLab keeps
+# registered fonts process-wide, so a successful answer holds for every roadmap
+# and save. Fallbacks are not stored: the font may be registered later.
+_pdf_font_names: dict[tuple[str, str], str] = {}
+# Font names known to be registered with ReportLab
+_registered_pdf_fonts: set[str] = set()
 
 
-@dataclass()
 class Roadmap:
     """The main Roadmap class"""
 
-    width: int = field(default=1200)
-    height: int = field(default=600)
-    colour_theme: str = field(default="DEFAULT")
-    show_marker: bool = field(default=True)
+    __slots__ = (
+        "width",
+        "height",
+        "colour_theme",
+        "show_marker",
+        "title",
+        "subtitle",
+        "timeline",
+        "groups",
+        "footer",
+        "marker",
+        "header",
+        "__painter",
+        "_pdf_body_font",
+        "_pdf_body_font_file",
+        "_font_family",
+        "_component_fonts",
+        "_font_files",
+        "_tag_palette",
+        "_tag_default_sequence",
+        "_tag_auto_palette",
+        "_tag_auto_counter",
+        "_tag_resolved",
+        "_tag_styles",
+        "_fonts_cache",
+        "_hex_colour_cache",
+    )
 
-    title: Title = field(default=None, init=False)
-    subtitle: Subtitle = field(default=None, init=False)
-    timeline: Timeline = field(default=None, init=False)
-    groups: list[Group] = field(default_factory=list, init=False)
-    footer: Footer = field(default=None, init=False)
-    marker: Marker = field(default=None, init=False)
-    header: Header = field(default=None, init=False)
+    width: int
+    height: int
+    colour_theme: str
+    show_marker: bool
+
+    title: Title
+    subtitle: Subtitle
+    timeline: Timeline
+    groups: list[Group]
+    footer: Footer
+    marker: Marker
+    header: Header
 
     __version__ = "v0.1.1"
 
-    def __post_init__(self):
-        """This method is called after __init__() is called"""
+    def __init__(
+        self,
+        width: int = 1200,
+        height: int = 600,
+        colour_theme: str = "DEFAULT",
+        show_marker: bool = True,
+    ) -> None:
+        """__init__ method
+
+        Args:
+            width (int, optional): Width of the roadmap. Defaults to 1200.
+            height (int, optional): Height of the roadmap. Defaults to 600.
+            colour_theme (str, optional): Colour theme. Defaults to "DEFAULT".
+            show_marker (bool, optional): Show the current date marker. Defaults to True.
+        """
+        self.width = width
+        self.height = height
+        self.colour_theme = colour_theme
+        self.show_marker = show_marker
+
+        self.title = None
+        self.subtitle = None
+        self.timeline = None
+        self.groups = []
+        self.footer = None
+        self.marker = None
+        self.header = None
+
         self.__painter = Painter(self.width, self.height)
         self.__set_colour_palette(self.colour_theme)
-        self.groups = []
         self._pdf_body_font = "Helvetica"
         self._pdf_body_font_file = ""
         self._font_family = self.__painter.title_font
@@ -78,6 +162,12 @@ class Roadmap:
             "#8C564B",
         ]
         self._tag_auto_palette: dict[str, str] = {}
+        self._tag_auto_counter = 0
+        # Explicit and auto-assigned tag colours, looked up together
+        self._tag_resolved: dict[str, str] = {}
+        # Tag -> (chip fill, contrasting label colour) for the PDF tag chips
+        self._tag_styles: dict[str, tuple] = {}
+        self._fonts_cache: Optional[dict[str, str]] = None
         if self.show_marker == True:
             self.__create_marker()
 
@@ -101,6 +191,28 @@ class Roadmap:
         self.__painter.milestone_fill_colour = accent_milestone
         self.__painter.milestone_font_colour = "#FFFFFF"
 
+        # Parse the palette once so PDF pages start with these colours ready
+        painter = self.__painter
+        palette_colours = {}
+        if colors is not None:
+            for colour in (
+                painter.background_colour,
+                painter.title_font_colour,
+                painter.timeline_font_colour,
+                painter.timeline_fill_colour,
+                painter.group_font_colour,
+                painter.group_fill_colour,
+                painter.task_font_colour,
+                painter.task_fill_colour,
+                painter.milestone_font_colour,
+                painter.milestone_fill_colour,
+                painter.marker_font_colour,
+                painter.marker_line_colour,
+            ):
+                if isinstance(colour, str) and colour.startswith("#"):
+                    palette_colours[colour] = colors.HexColor(colour)
+        self._hex_colour_cache = palette_colours
+
         if self.marker is not None:
             self.marker.line_colour = accent_milestone
             self.marker.font_colour = accent_milestone
@@ -133,6 +245,7 @@ class Roadmap:
         if line_colour == "":
             line_colour = self.__painter.marker_line_colour
 
+        self._fonts_cache = None
         self.marker = Marker(
             font=label_text_font,
             font_size=label_text_size,
@@ -170,12 +283,13 @@ class Roadmap:
         if line_colour == "":
             line_colour = self.__painter.marker_line_colour
 
+        self._fonts_cache = None
         self.marker.font = label_text_font
         self.marker.font_size = label_text_size
-        self.font_colour = label_text_colour
-        self.line_colour = line_colour
-        self.line_width = line_width
-        self.line_style = line_style
+        self.marker.font_colour = label_text_colour
+        self.marker.line_colour = line_colour
+        self.marker.line_width = line_width
+        self.marker.line_style = line_style
 
     def set_fonts(
         self,
@@ -194,6 +308,7 @@ class Roadmap:
         if font_files:
             self._font_files.update(font_files)
         self.__painter.override_fonts(family, component_fonts or {}, font_files)
+        self._fonts_cache = None
         if pdf_font_name:
             self._pdf_body_font = pdf_font_name
         elif family:
@@ -220,22 +335,44 @@ class Roadmap:
         if not getattr(self, "_tag_default_sequence", None):
             self._tag_default_sequence = ["#1F77B4"]
         self._tag_auto_palette = {}
+        self._tag_auto_counter = 0
+        self._tag_resolved = dict(self._tag_palette)
+        self._tag_styles = {}
 
     def _resolve_tag_colour(self, tag: str) -> str:
         """Return a hex colour associated with the provided tag."""
         if not tag:
             return "#2E334E"
         key = str(tag)
-        if key in self._tag_palette:
-            return self._tag_palette[key]
-        if key in self._tag_auto_palette:
-            return self._tag_auto_palette[key]
+        colour = self._tag_resolved.get(key)
+        if colour is not None:
+            return colour
         palette = self._tag_default_sequence or ["#1F77B4"]
-        index = len(self._tag_auto_palette) % len(palette)
-        colour = palette[index]
+        colour = palette[self._tag_auto_counter % len(palette)]
+        self._tag_auto_counter += 1
         self._tag_auto_palette[key] = colour
+        self._tag_resolved[key] = colour
         return colour
 
+    def _resolve_tag_style(self, tag: str) -> tuple:
+        """Return the chip fill colour and a contrasting label colour for a tag."""
+        style = self._tag_styles.get(tag)
+        if style is not None:
+            return style
+        colour_value = self._resolve_tag_colour(tag)
+        try:
+            fill_colour = colors.toColor(colour_value)
+        except Exception:  # pragma: no cover - defensive conversion
+            fill_colour = self.__hex_colour("#2E334E")
+        luminance = (
+            (0.299 * fill_colour.red)
+            + (0.587 * fill_colour.green)
+            + (0.114 * fill_colour.blue)
+        )
+        text_colour = colors.white if luminance < 0.6 else colors.black
+        style = self._tag_styles[tag] = (fill_colour, text_colour)
+        return style
+
     def set_header(
         self,
         logo_path: str = "",
@@ -377,9 +514,7 @@ class Roadmap:
     def set_timeline(
         self,
         mode: TimelineMode = TimelineMode.MONTHLY,
-        start: datetime = datetime.strptime(
-            datetime.strftime(datetime.today(), "%Y-%m-%d"), "%Y-%m-%d"
-        ),
+        start: Optional[Union[datetime, str]] = None,
         number_of_items: int = 12,
         show_generic_dates: bool = False,
         font: str = "",
@@ -392,7 +527,7 @@ class Roadmap:
         Args:
             mode (TimelineMode, optional): Timeline mode. Defaults to TimelineMode.MONTHLY.
                                             Options are WEEKLY, MONTHLY, QUARTERLY, HALF_YEARLY, YEARLY
-            start (datetime, optional): Timeline start date. Defaults to current date
+            start (datetime or str, optional): Timeline start date, either a datetime or a "YYYY-MM-DD" string. Defaults to current date
             number_of_items (int, optional): Number of time periods to display on the timeline. Defaults to 12.
             font (str, optional): Timeline font. Defaults to "Arial".
             font_size (int, optional): Timeline font size. Defaults to 10.
@@ -408,7 +543,14 @@ class Roadmap:
         if fill_colour == "":
             fill_colour = self.__painter.timeline_fill_colour
 
-        start_date = datetime.strptime(start, "%Y-%m-%d")
+        if start is None:
+            start_date = datetime.today().replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+        elif isinstance(start, str):
+            start_date = datetime.strptime(start, "%Y-%m-%d")
+        else:
+            start_date = start
         self.timeline = Timeline(
             mode=mode,
             start=start_date,
@@ -470,37 +612,63 @@ class Roadmap:
 
         return group
 
-    def draw(self) -> None:
-        """Draw the roadmap"""
-        self.__painter.set_background_colour()
+    def layout(self) -> None:
+        """Work out the position of every roadmap component without painting.
 
+        draw() calls this before painting; the PDF export calls it directly for
+        detail roadmaps, which are rendered through ReportLab rather than cairo.
+        """
+        painter = self.__painter
         if self.header is not None:
-            self.header.draw(self.__painter)
-        else:
-            if self.title == None:
-                raise ValueError("Title is not set. Please call set_title() to set title.")
-            self.title.draw(self.__painter)
-            if self.subtitle is not None:
-                self.subtitle.draw(self.__painter)
+            painter.last_drawn_y_pos = self.header.measure(painter)
+        elif self.title == None:
+            raise ValueError("Title is not set. Please call set_title() to set title.")
 
         if self.timeline == None:
             raise ValueError(
                 "Timeline is not set. Please call set_timeline() to set timeline."
             )
-        self.timeline.set_draw_position(self.__painter)
-        self.timeline.draw(self.__painter)
+        self.timeline.set_draw_position(painter)
 
+        # Groups are stacked: each one starts at the painter's last_drawn_y_pos
+        # left by the previous group, and measuring text goes through the one
+        # shared cairo context, so this pass has to stay sequential
         for group in self.groups:
-            group.set_draw_position(self.__painter, self.timeline)
-            group.draw(self.__painter)
+            group.set_draw_position(painter, self.timeline)
 
         if self.marker != None:
-            self.marker.set_line_draw_position(self.__painter)
-            self.marker.draw(self.__painter)
+            self.marker.set_line_draw_position(painter)
 
         if self.footer != None:
-            self.footer.set_draw_position(self.__painter)
-            self.footer.draw(self.__painter)
+            self.footer.set_draw_position(painter)
+
+    def draw(self) -> None:
+        """Draw the roadmap"""
+        painter = self.__painter
+        self.layout()
+        last_drawn_y_pos = painter.last_drawn_y_pos
+
+        painter.set_background_colour()
+        if self.header is not None:
+            self.header.draw(painter)
+        else:
+            self.title.draw(painter)
+            if self.subtitle is not None:
+                self.subtitle.draw(painter)
+
+        self.timeline.draw(painter)
+        for group in self.groups:
+            group.draw(painter)
+
+        if self.marker != None:
+            self.marker.draw(painter)
+
+        if self.footer != None:
+            self.footer.draw(painter)
+
+        # Header.draw() rewinds the cursor to the header bottom; keep the
+        # position layout() ended on
+        painter.last_drawn_y_pos = last_drawn_y_pos
 
     def iter_tasks(self):
         """Yield all tasks contained in the roadmap."""
@@ -509,13 +677,13 @@ class Roadmap:
 
     def __detail_tasks(self):
         """Return tasks that have detail content configured."""
-        return [
-            task
-            for task in self.iter_tasks()
-            if hasattr(task, "has_detail") and task.has_detail
-        ]
+        return list(filter(_has_detail, self.iter_tasks()))
 
     def __collect_font_names(self) -> dict[str, str]:
+        # Callers overwrite entries with their resolved PDF font names, so
+        # hand out a copy of the cached mapping
+        if self._fonts_cache is not None:
+            return dict(self._fonts_cache)
         base = self._font_family or self.__painter.title_font
         fonts = {
             "title": self._component_fonts.get("title", base),
@@ -529,7 +697,15 @@ class Roadmap:
             fonts["marker"] = self.marker.font
         else:
             fonts["marker"] = fonts["timeline"]
-        return fonts
+        self._fonts_cache = fonts
+        return dict(fonts)
+
+    def __hex_colour(self, colour: str):
+        """Return the ReportLab colour for a hex string, parsing each string once."""
+        converted = self._hex_colour_cache.get(colour)
+        if converted is None:
+            converted = self._hex_colour_cache[colour] = colors.HexColor(colour)
+        return converted
 
     def __draw_pdf_header_block(
         self,
@@ -538,26 +714,26 @@ class Roadmap:
         heading_font_name: str,
         subtitle_font_name: str,
     ) -> float:
-        from reportlab.lib import colors
-
         if header_obj is None:
             return float(self.height)
 
-        header_height = header_obj.height or header_obj.measure(self.__painter)
+        painter = self.__painter
+        title_font_size = painter.title_font_size
+        header_height = header_obj.height or header_obj.measure(painter)
         header_top = float(self.height)
         header_bottom = header_top - header_height
 
-        bg_colour = header_obj.background_colour or self.__painter.background_colour
-        pdf_canvas.saveState()
-        pdf_canvas.setFillColor(colors.HexColor(bg_colour))
+        bg_colour = header_obj.background_colour or painter.background_colour
+        pdf_canvas.setFillColor(self.__hex_colour(bg_colour))
         pdf_canvas.rect(0, header_bottom, self.width, header_height, stroke=0, fill=1)
-        pdf_canvas.restoreState()
 
         content_x = float(header_obj.padding_x)
         content_height = header_height - (header_obj.padding_y * 2)
         if header_obj.logo_path:
-            logo_y = header_bottom + header_obj.padding_y + max(
-                (content_height - header_obj.logo_height) / 2.0, 0.0
+            logo_y = (
+                header_bottom
+                + header_obj.padding_y
+                + (content_height - header_obj.logo_height) * 0.5
             )
             pdf_canvas.drawImage(
                 header_obj.logo_path,
@@ -570,20 +746,20 @@ class Roadmap:
             )
             content_x += header_obj.logo_width + header_obj.logo_spacing
 
-        title_baseline = header_bottom + header_obj.padding_y + self.__painter.title_font_size
-        pdf_canvas.setFont(heading_font_name, self.__painter.title_font_size)
-        pdf_canvas.setFillColor(colors.HexColor(self.__painter.title_font_colour))
+        title_baseline = header_bottom + header_obj.padding_y + title_font_size
+        pdf_canvas.setFont(heading_font_name, title_font_size)
+        pdf_canvas.setFillColor(self.__hex_colour(painter.title_font_colour))
         pdf_canvas.drawString(content_x, title_baseline, header_obj.title)
 
         if header_obj.subtitle:
-            subtitle_font_size = max(self.__painter.title_font_size - 4, 10)
+            subtitle_font_size = max(title_font_size - 4, 10)
             subtitle_baseline = title_baseline - subtitle_font_size - 4
             pdf_canvas.setFont(subtitle_font_name, subtitle_font_size)
-            pdf_canvas.setFillColor(colors.HexColor(self.__painter.timeline_font_colour))
+            pdf_canvas.setFillColor(self.__hex_colour(painter.timeline_font_colour))
             pdf_canvas.drawString(content_x, subtitle_baseline, header_obj.subtitle)
 
         if header_obj.divider_colour:
-            pdf_canvas.setStrokeColor(colors.HexColor(header_obj.divider_colour))
+            pdf_canvas.setStrokeColor(self.__hex_colour(header_obj.divider_colour))
             pdf_canvas.setLineWidth(1)
             pdf_canvas.line(0, header_bottom, self.width, header_bottom)
 
@@ -596,21 +772,21 @@ class Roadmap:
         body_font_name: str,
         heading_font_name: str,
     ) -> None:
-        from reportlab.lib import colors
-
         height = self.height
         width = self.width
+        painter = self.__painter
+        title_font_size = painter.title_font_size
 
+        # Only the few header, title, marker and footer positions go through
+        # here; shape and label coordinates are flipped as they are collected
         def to_pdf_y(y: float) -> float:
             return height - y
 
-        def rect_y(y: float, h: float) -> float:
-            return height - (y + h)
+        # The same handful of palette colours is converted for every shape
+        hex_colour = self.__hex_colour
 
-        pdf_canvas.saveState()
-        pdf_canvas.setFillColor(colors.HexColor(self.__painter.background_colour))
+        pdf_canvas.setFillColor(hex_colour(painter.background_colour))
         pdf_canvas.rect(0, 0, width, height, stroke=0, fill=1)
-        pdf_canvas.restoreState()
 
         title_font = fonts_map.get("title", heading_font_name)
         timeline_font = fonts_map.get("timeline", body_font_name)
@@ -624,11 +800,9 @@ class Roadmap:
             header_height = self.header.height or 0
             header_top = height
             header_bottom = header_top - header_height
-            bg_colour = self.header.background_colour or self.__painter.background_colour
-            pdf_canvas.saveState()
-            pdf_canvas.setFillColor(colors.HexColor(bg_colour))
+            bg_colour = self.header.background_colour or painter.background_colour
+            pdf_canvas.setFillColor(hex_colour(bg_colour))
             pdf_canvas.rect(0, header_bottom, width, header_height, stroke=0, fill=1)
-            pdf_canvas.restoreState()
 
             content_x = float(self.header.padding_x)
             if self.header.logo_path:
@@ -644,172 +818,195 @@ class Roadmap:
                 )
                 content_x += self.header.logo_width + self.header.logo_spacing
 
-            title_baseline = to_pdf_y(self.header.padding_y + self.__painter.title_font_size)
-            pdf_canvas.setFont(title_font, self.__painter.title_font_size)
-            pdf_canvas.setFillColor(colors.HexColor(self.__painter.title_font_colour))
+            title_baseline = to_pdf_y(self.header.padding_y + title_font_size)
+            pdf_canvas.setFont(title_font, title_font_size)
+            pdf_canvas.setFillColor(hex_colour(painter.title_font_colour))
             pdf_canvas.drawString(content_x, title_baseline, self.header.title)
 
             if self.header.subtitle:
-                subtitle_font_size = max(self.__painter.title_font_size - 4, 10)
+                subtitle_font_size = max(title_font_size - 4, 10)
                 subtitle_baseline = to_pdf_y(
-                    self.header.padding_y + self.__painter.title_font_size + subtitle_font_size + 4
+                    self.header.padding_y + title_font_size + subtitle_font_size + 4
                 )
                 pdf_canvas.setFont(timeline_font, subtitle_font_size)
-                pdf_canvas.setFillColor(colors.HexColor(self.__painter.timeline_font_colour))
+                pdf_canvas.setFillColor(hex_colour(painter.timeline_font_colour))
                 pdf_canvas.drawString(content_x, subtitle_baseline, self.header.subtitle)
 
             if self.header.divider_colour:
-                pdf_canvas.setStrokeColor(colors.HexColor(self.header.divider_colour))
+                pdf_canvas.setStrokeColor(hex_colour(self.header.divider_colour))
                 pdf_canvas.setLineWidth(1)
                 pdf_canvas.line(0, header_bottom, width, header_bottom)
         else:
             if self.title is not None:
                 pdf_canvas.setFont(title_font, self.title.font_size)
-                pdf_canvas.setFillColor(colors.HexColor(self.title.font_colour))
+                pdf_canvas.setFillColor(hex_colour(self.title.font_colour))
                 pdf_canvas.drawString(self.title.x, to_pdf_y(self.title.y), self.title.text)
             if self.subtitle is not None:
                 pdf_canvas.setFont(timeline_font, self.subtitle.font_size)
-                pdf_canvas.setFillColor(colors.HexColor(self.subtitle.font_colour))
+                pdf_canvas.setFillColor(hex_colour(self.subtitle.font_colour))
                 pdf_canvas.drawString(
                     self.subtitle.x,
                     to_pdf_y(self.subtitle.y),
                     self.subtitle.text,
                 )
 
+        # Shapes are collected per fill colour and painted in one run per
+        # colour; labels are drawn afterwards so they always sit on top.
+        # Coordinates are flipped to PDF space inline while collecting.
+        rects_by_fill: dict[str, list] = {}
+        diamonds_by_fill: dict[str, list] = {}
+        labels_by_style: dict[tuple, list] = {}
+
+        def add_label(
+            font: str, font_size: int, font_colour: str, x: float, y: float, text: str
+        ) -> None:
+            labels_by_style.setdefault((font, font_size, font_colour), []).append(
+                (x, y, text)
+            )
+
+        def is_off_page(x: float, y: float, w: float, h: float) -> bool:
+            return x + w < 0 or x > width or y + h < 0 or y > height
+
+        def add_task(task) -> None:
+            # Tasks running past the end of the timeline are never visible
+            rects_by_fill.setdefault(task.fill_colour, []).extend(
+                (box_x, height - (box_y + box_height), box_width, box_height)
+                for box_x, box_y, box_width, box_height in task.boxes
+                if not is_off_page(box_x, box_y, box_width, box_height)
+            )
+            add_label(
+                task_font,
+                task.font_size,
+                task.font_colour,
+                task.text_x,
+                height - task.text_y,
+                task.text,
+            )
+            for milestone in task.milestones:
+                if not is_off_page(
+                    milestone.diamond_x,
+                    milestone.diamond_y,
+                    milestone.diamond_width,
+                    milestone.diamond_height,
+                ):
+                    diamonds_by_fill.setdefault(milestone.fill_colour, []).append(
+                        (
+                            milestone.diamond_x,
+                            height - (milestone.diamond_y + milestone.diamond_height),
+                            milestone.diamond_width,
+                            milestone.diamond_height,
+                        )
+                    )
+                add_label(
+                    milestone_font,
+                    milestone.font_size,
+                    milestone.font_colour,
+                    milestone.text_x,
+                    height - milestone.text_y,
+                    milestone.text,
+                )
+
         # Timeline
         if self.timeline is not None:
-            pdf_canvas.setFont(timeline_font, self.timeline.font_size)
-            pdf_canvas.setFillColor(colors.HexColor(self.__painter.timeline_font_colour))
+            rects = rects_by_fill.setdefault(painter.timeline_fill_colour, [])
+            timeline_font_size = self.timeline.font_size
+            timeline_font_colour = painter.timeline_font_colour
             for timeline_item in self.timeline.timeline_items:
-                pdf_canvas.saveState()
-                pdf_canvas.setFillColor(colors.HexColor(self.__painter.timeline_fill_colour))
-                pdf_canvas.rect(
-                    timeline_item.box_x,
-                    rect_y(timeline_item.box_y, timeline_item.box_height),
-                    timeline_item.box_width,
-                    timeline_item.box_height,
-                    stroke=0,
-                    fill=1,
+                rects.append(
+                    (
+                        timeline_item.box_x,
+                        height - (timeline_item.box_y + timeline_item.box_height),
+                        timeline_item.box_width,
+                        timeline_item.box_height,
+                    )
                 )
-                pdf_canvas.restoreState()
-                pdf_canvas.setFillColor(colors.HexColor(self.__painter.timeline_font_colour))
-                pdf_canvas.drawString(
+                add_label(
+                    timeline_font,
+                    timeline_font_size,
+                    timeline_font_colour,
                     timeline_item.text_x,
-                    to_pdf_y(timeline_item.text_y),
+                    height - timeline_item.text_y,
                     timeline_item.text,
                 )
 
         # Groups and tasks
         for group in self.groups:
-            pdf_canvas.saveState()
-            pdf_canvas.setFillColor(colors.HexColor(group.fill_colour))
-            pdf_canvas.rect(
-                group.box_x,
-                rect_y(group.box_y, group.box_height),
-                group.box_width,
-                group.box_height,
-                stroke=0,
-                fill=1,
+            rects_by_fill.setdefault(group.fill_colour, []).append(
+                (
+                    group.box_x,
+                    height - (group.box_y + group.box_height),
+                    group.box_width,
+                    group.box_height,
+                )
+            )
+            add_label(
+                group_font,
+                group.font_size,
+                group.font_colour,
+                group.text_x,
+                height - group.text_y,
+                group.text,
             )
-            pdf_canvas.restoreState()
-            pdf_canvas.setFont(group_font, group.font_size)
-            pdf_canvas.setFillColor(colors.HexColor(group.font_colour))
-            pdf_canvas.drawString(group.text_x, to_pdf_y(group.text_y), group.text)
-
             for task in group.tasks:
-                pdf_canvas.saveState()
-                pdf_canvas.setFillColor(colors.HexColor(task.fill_colour))
-                for box_x, box_y, box_width, box_height in task.boxes:
-                    pdf_canvas.rect(
-                        box_x,
-                        rect_y(box_y, box_height),
-                        box_width,
-                        box_height,
-                        stroke=0,
-                        fill=1,
-                    )
-                pdf_canvas.restoreState()
-                pdf_canvas.setFont(task_font, task.font_size)
-                pdf_canvas.setFillColor(colors.HexColor(task.font_colour))
-                pdf_canvas.drawString(task.text_x, to_pdf_y(task.text_y), task.text)
-
-                for milestone in task.milestones:
-                    pdf_canvas.saveState()
-                    pdf_canvas.setFillColor(colors.HexColor(milestone.fill_colour))
-                    path = pdf_canvas.beginPath()
-                    x = milestone.diamond_x
-                    y = rect_y(milestone.diamond_y, milestone.diamond_height)
-                    w = milestone.diamond_width
-                    h = milestone.diamond_height
-                    path.moveTo(x + w / 2, y + h)
-                    path.lineTo(x + w, y + h / 2)
-                    path.lineTo(x + w / 2, y)
-                    path.lineTo(x, y + h / 2)
-                    path.close()
-                    pdf_canvas.drawPath(path, stroke=0, fill=1)
-                    pdf_canvas.restoreState()
-                    pdf_canvas.setFont(milestone_font, milestone.font_size)
-                    pdf_canvas.setFillColor(colors.HexColor(milestone.font_colour))
-                    pdf_canvas.drawString(
-                        milestone.text_x,
-                        to_pdf_y(milestone.text_y),
-                        milestone.text,
-                    )
-
+                add_task(task)
                 for parallel_task in task.tasks:
-                    pdf_canvas.saveState()
-                    pdf_canvas.setFillColor(colors.HexColor(parallel_task.fill_colour))
-                    for box_x, box_y, box_width, box_height in parallel_task.boxes:
-                        pdf_canvas.rect(
-                            box_x,
-                            rect_y(box_y, box_height),
-                            box_width,
-                            box_height,
-                            stroke=0,
-                            fill=1,
-                        )
-                    pdf_canvas.restoreState()
-                    pdf_canvas.setFont(task_font, parallel_task.font_size)
-                    pdf_canvas.setFillColor(colors.HexColor(parallel_task.font_colour))
-                    pdf_canvas.drawString(
-                        parallel_task.text_x,
-                        to_pdf_y(parallel_task.text_y),
-                        parallel_task.text,
-                    )
-                    for pt_milestone in parallel_task.milestones:
-                        pdf_canvas.saveState()
-                        pdf_canvas.setFillColor(colors.HexColor(pt_milestone.fill_colour))
-                        path = pdf_canvas.beginPath()
-                        x = pt_milestone.diamond_x
-                        y = rect_y(pt_milestone.diamond_y, pt_milestone.diamond_height)
-                        w = pt_milestone.diamond_width
-                        h = pt_milestone.diamond_height
-                        path.moveTo(x + w / 2, y + h)
-                        path.lineTo(x + w, y + h / 2)
-                        path.lineTo(x + w / 2, y)
-                        path.lineTo(x, y + h / 2)
-                        path.close()
-                        pdf_canvas.drawPath(path, stroke=0, fill=1)
-                        pdf_canvas.restoreState()
-                        pdf_canvas.setFont(milestone_font, pt_milestone.font_size)
-                        pdf_canvas.setFillColor(colors.HexColor(pt_milestone.font_colour))
-                        pdf_canvas.drawString(
-                            pt_milestone.text_x,
-                            to_pdf_y(pt_milestone.text_y),
-                            pt_milestone.text,
-                        )
+                    add_task(parallel_task)
+
+        # Rectangles are by far the most numerous shapes, so their "re" operators
+        # are formatted directly rather than through a path object; "f" fills
+        # them with the non-zero winding rule
+        for fill_colour, rects in rects_by_fill.items():
+            if not rects:
+                continue
+            pdf_canvas.setFillColor(hex_colour(fill_colour))
+            pdf_canvas.addLiteral(
+                " ".join(f"{fp_str(x, y, w, h)} re" for x, y, w, h in rects)
+            )
+            pdf_canvas.addLiteral("f")
+
+        # Milestones go on top of the task bars they mark. Every diamond of a
+        # colour is a sub-path of one path; non-zero winding keeps overlapping
+        # diamonds filled instead of punching holes in each other. Diamonds
+        # share a handful of sizes, so their half extents are worked out once.
+        diamond_halves: dict[tuple[float, float], tuple[float, float]] = {}
+        for fill_colour, diamonds in diamonds_by_fill.items():
+            pdf_canvas.setFillColor(hex_colour(fill_colour))
+            path = pdf_canvas.beginPath()
+            for x, y, w, h in diamonds:
+                halves = diamond_halves.get((w, h))
+                if halves is None:
+                    halves = diamond_halves[(w, h)] = (w / 2, h / 2)
+                half_w, half_h = halves
+                path.moveTo(x + half_w, y + h)
+                path.lineTo(x + w, y + half_h)
+                path.lineTo(x + half_w, y)
+                path.lineTo(x, y + half_h)
+                path.close()
+            pdf_canvas.drawPath(path, stroke=0, fill=1, fillMode=FILL_NON_ZERO)
+
+        # One text object per style keeps font and colour operators out of
+        # the per-label stream
+        for (font, font_size, font_colour), runs in labels_by_style.items():
+            text_object = pdf_canvas.beginText()
+            text_object.setFont(font, font_size)
+            text_object.setFillColor(hex_colour(font_colour))
+            for x, y, text in runs:
+                text_object.setTextOrigin(x, y)
+                text_object.textOut(text)
+            pdf_canvas.drawText(text_object)
 
         # Marker
+        # Nothing stroked is drawn after the marker, so its line settings can
+        # stay on the graphics state instead of being pushed and popped
         if self.marker is not None:
-            pdf_canvas.saveState()
             pdf_canvas.setFont(marker_font, self.marker.font_size)
-            pdf_canvas.setFillColor(colors.HexColor(self.marker.font_colour))
+            pdf_canvas.setFillColor(hex_colour(self.marker.font_colour))
             pdf_canvas.drawString(
                 self.marker.label_x,
                 to_pdf_y(self.marker.label_y + 10),
                 self.marker.text,
             )
-            pdf_canvas.setStrokeColor(colors.HexColor(self.marker.line_colour))
+            pdf_canvas.setStrokeColor(hex_colour(self.marker.line_colour))
             pdf_canvas.setLineWidth(self.marker.line_width)
             pdf_canvas.line(
                 self.marker.line_from_x,
@@ -817,11 +1014,10 @@ class Roadmap:
                 self.marker.line_to_x,
                 to_pdf_y(self.marker.line_to_y),
             )
-            pdf_canvas.restoreState()
 
         if self.footer is not None:
             pdf_canvas.setFont(fonts_map.get("group", body_font_name), self.footer.font_size)
-            pdf_canvas.setFillColor(colors.HexColor(self.footer.font_colour))
+            pdf_canvas.setFillColor(hex_colour(self.footer.font_colour))
             pdf_canvas.drawString(
                 self.footer.x,
                 to_pdf_y(self.footer.y),
@@ -830,16 +1026,8 @@ class Roadmap:
 
     def __save_pdf(self, output_path: Path) -> None:
         """Generate an interactive PDF with clickable roadmap items."""
-        try:
-            from reportlab.pdfgen import canvas
-            from reportlab.lib import colors
-            from reportlab.lib.utils import simpleSplit
-            from reportlab.pdfbase import pdfmetrics
-            from reportlab.pdfbase.ttfonts import TTFont
-        except ImportError as exc:  # pragma: no cover - guarded for runtime feedback
-            raise RuntimeError(
-                "reportlab is required to export interactive PDFs."
-            ) from exc
+        if not _REPORTLAB_AVAILABLE:  # pragma: no cover - guarded for runtime feedback
+            raise RuntimeError("reportlab is required to export interactive PDFs.")
 
         pdf_canvas = canvas.Canvas(str(output_path), pagesize=(self.width, self.height))
         document_title = self.title.text if self.title else output_path.stem
@@ -854,10 +1042,19 @@ class Roadmap:
         fonts_map = self.__collect_font_names()
         component_font_files = self._font_files
         nested_artifacts = {}
+        # Tasks sharing a builder share one nested roadmap (and its PDF form)
+        # Builders run in this process: they are typically closures and return a
+        # Roadmap holding a cairo surface, neither of which can be pickled over
+        # to worker processes
+        nested_by_builder: dict[int, Roadmap] = {}
         for task in detail_tasks:
-            builder = getattr(task, "detail_roadmap_builder", None)
+            builder = task.detail_roadmap_builder
             if builder is None:
                 continue
+            nested_roadmap = nested_by_builder.get(id(builder))
+            if nested_roadmap is not None:
+                nested_artifacts[task.identifier] = nested_roadmap
+                continue
             try:
                 nested_roadmap = builder()
             except Exception as exc:  # pragma: no cover - runtime guard
@@ -870,46 +1067,98 @@ class Roadmap:
                 raise TypeError(
                     "Detail roadmap builder must return a Roadmap instance."
                 )
-            nested_roadmap.draw()
+            nested_roadmap.layout()
+            nested_by_builder[id(builder)] = nested_roadmap
             nested_artifacts[task.identifier] = nested_roadmap
 
-        def ensure_pdf_font(font_name: str, font_file: str) -> str:
+        # Resolve every tag shown on the detail pages in one walk, in page
+        # order so auto-assigned colours land on the same tags as before
+        tag_styles = self._tag_styles
+        for task in detail_tasks:
+            tagged = [task]
+            nested_overview = nested_artifacts.get(task.identifier)
+            if nested_overview is not None:
+                for group in nested_overview.groups:
+                    for subtask in group.tasks:
+                        tagged.append(subtask)
+                        tagged.extend(subtask.tasks)
+            for tagged_task in tagged:
+                for raw in tagged_task.tags:
+                    label = str(raw).strip()
+                    if label and label not in tag_styles:
+                        self._resolve_tag_style(label)
+
+        def register_pdf_font(font_name: str, font_file: str) -> str:
             candidate = font_name or "Helvetica"
-            if candidate in pdfmetrics.getRegisteredFontNames():
+            if candidate in _registered_pdf_fonts:
                 return candidate
             if candidate in pdfmetrics.standardFonts:
                 return candidate
             if font_file:
                 try:
                     pdfmetrics.registerFont(TTFont(candidate, font_file))
-                    return candidate
                 except Exception:
-                    return "Helvetica"
+                    pass
+                else:
+                    _registered_pdf_fonts.add(candidate)
+                    return candidate
+            # The font may have been registered outside this module
+            _registered_pdf_fonts.update(pdfmetrics.getRegisteredFontNames())
+            if candidate in _registered_pdf_fonts:
+                return candidate
             return "Helvetica"
 
+        def ensure_pdf_font(font_name: str, font_file: str) -> str:
+            key = (font_name, font_file)
+            resolved = _pdf_font_names.get(key)
+            if resolved is None:
+                resolved = register_pdf_font(font_name, font_file)
+                if resolved == (font_name or "Helvetica"):
+                    _pdf_font_names[key] = resolved
+            return resolved
+
+        # Components usually share one or two fonts; resolve each name once
+        resolved_fonts: dict[str, str] = {}
+
         def ensure_fonts_for(font_name: str) -> str:
+            resolved = resolved_fonts.get(font_name)
+            if resolved is not None:
+                return resolved
             if not font_name:
-                return ensure_pdf_font("Helvetica", "")
-            file_path = component_font_files.get(font_name, "")
-            if not file_path and font_name == getattr(self, "_pdf_body_font", ""):
-                file_path = getattr(self, "_pdf_body_font_file", "")
-            return ensure_pdf_font(font_name, file_path)
-
-        body_font_name = ensure_fonts_for(
-            getattr(self, "_pdf_body_font", fonts_map.get("task", ""))
-        )
+                resolved = ensure_pdf_font("Helvetica", "")
+            else:
+                file_path = component_font_files.get(font_name, "")
+                if not file_path and font_name == self._pdf_body_font:
+                    file_path = self._pdf_body_font_file
+                resolved = ensure_pdf_font(font_name, file_path)
+            resolved_fonts[font_name] = resolved
+            return resolved
+
+        body_font_name = ensure_fonts_for(self._pdf_body_font)
         fonts_map["body"] = body_font_name
         heading_font_name = ensure_fonts_for(fonts_map.get("title", body_font_name))
         fonts_map["title"] = heading_font_name
-        fonts_map["timeline"] = ensure_fonts_for(fonts_map.get("timeline", body_font_name))
-        fonts_map["group"] = ensure_fonts_for(fonts_map.get("group", body_font_name))
-        fonts_map["task"] = ensure_fonts_for(fonts_map.get("task", body_font_name))
-        fonts_map["milestone"] = ensure_fonts_for(fonts_map.get("milestone", body_font_name))
+        for component in ("timeline", "group", "task", "milestone"):
+            fonts_map[component] = ensure_fonts_for(
+                fonts_map.get(component, body_font_name)
+            )
         if self.marker is not None:
             fonts_map["marker"] = ensure_fonts_for(self.marker.font)
         else:
             fonts_map["marker"] = fonts_map["timeline"]
 
+        # Button captions and tag names repeat across detail pages
+        string_widths: dict[tuple[str, str, int], float] = {}
+
+        def string_width(text: str, font_name: str, font_size: int) -> float:
+            key = (text, font_name, font_size)
+            text_width = string_widths.get(key)
+            if text_width is None:
+                text_width = string_widths[key] = pdf_canvas.stringWidth(
+                    text, font_name, font_size
+                )
+            return text_width
+
         def draw_nav_button(
             text: str,
             destination: str,
@@ -920,7 +1169,7 @@ class Roadmap:
             font_name: str = heading_font_name,
             font_size: int = 12,
         ) -> None:
-            pdf_canvas.setFillColor(colors.HexColor("#1f77b4"))
+            pdf_canvas.setFillColor(self.__hex_colour("#1f77b4"))
             pdf_canvas.roundRect(
                 x,
                 y,
@@ -932,7 +1181,7 @@ class Roadmap:
             )
             pdf_canvas.setFillColor(colors.white)
             pdf_canvas.setFont(font_name, font_size)
-            text_width = pdf_canvas.stringWidth(text, font_name, font_size)
+            text_width = string_width(text, font_name, font_size)
             pdf_canvas.drawString(
                 x + (width - text_width) / 2,
                 y + (height - font_size) / 2 + 4,
@@ -947,19 +1196,23 @@ class Roadmap:
             )
             pdf_canvas.setFillColor(colors.black)
 
-        def draw_tag_chips(
-            tags: list[str],
-            *,
-            start_x: float,
-            start_y: float,
-            max_x: float,
-            font_name: str,
-            font_size: int = 10,
-        ) -> float:
-            """Render tag chips and return the next baseline y-position."""
-            if not tags:
-                return start_y
-
+        @lru_cache(maxsize=1024)
+        def layout_tag_chips(
+            tags: tuple, font_name: str, font_size: int, max_width: float
+        ) -> tuple:
+            """Lay out tag chips relative to the top-left corner of the first chip.
+
+            Args:
+                tags: The tags in display order; blanks and repeats are skipped.
+                font_name: Registered font used for the chip labels.
+                font_size: Label font size.
+                max_width: Width available before chips wrap to a new line.
+
+            Returns:
+                A tuple of the chip line height, the chip rects grouped per fill
+                colour, the labels in reading order and the lowest chip offset,
+                or None when there is nothing to draw.
+            """
             unique_labels = []
             seen = set()
             for raw in tags:
@@ -970,72 +1223,115 @@ class Roadmap:
                 unique_labels.append(label)
 
             if not unique_labels:
-                return start_y
+                return None
 
             padding_x = 6
             padding_y = 3
             gap_x = 6
             line_height = font_size + (padding_y * 2)
 
-            pdf_canvas.setFont(font_name, font_size)
-
-            current_x = start_x
-            line_top = start_y
+            current_x = 0.0
+            line_top = 0.0
             lowest_y = line_top - line_height
+            # Chips never overlap, so every chip of a colour can share one path;
+            # labels keep their reading order in a single text object
+            chips_by_colour: dict = {}
+            labels = []
 
             for label in unique_labels:
-                colour_value = self._resolve_tag_colour(label)
-                try:
-                    fill_colour = colors.toColor(colour_value)
-                except Exception:  # pragma: no cover - defensive conversion
-                    fill_colour = colors.HexColor("#2E334E")
+                chip_style = tag_styles.get(label)
+                if chip_style is None:
+                    chip_style = self._resolve_tag_style(label)
+                fill_colour, text_colour = chip_style
 
                 chip_width = (
-                    pdf_canvas.stringWidth(label, font_name, font_size)
+                    string_width(label, font_name, font_size)
                     + (padding_x * 2)
                 )
 
-                if current_x + chip_width > max_x and current_x > start_x:
-                    current_x = start_x
+                if current_x + chip_width > max_width and current_x > 0:
+                    current_x = 0.0
                     line_top -= line_height + 4
 
                 chip_bottom = line_top - line_height
-                pdf_canvas.setFillColor(fill_colour)
-                pdf_canvas.roundRect(
-                    current_x,
-                    chip_bottom,
-                    chip_width,
-                    line_height,
-                    radius=line_height / 2,
-                    stroke=0,
-                    fill=1,
+                chips_by_colour.setdefault(fill_colour, []).append(
+                    (current_x, chip_bottom, chip_width)
                 )
-
-                luminance = (
-                    (0.299 * fill_colour.red)
-                    + (0.587 * fill_colour.green)
-                    + (0.114 * fill_colour.blue)
-                )
-                text_colour = colors.white if luminance < 0.6 else colors.black
-                pdf_canvas.setFillColor(text_colour)
-                pdf_canvas.drawString(
-                    current_x + padding_x,
-                    chip_bottom + padding_y + (font_size * 0.1),
-                    label,
+                labels.append(
+                    (
+                        current_x + padding_x,
+                        chip_bottom + padding_y + (font_size * 0.1),
+                        label,
+                        text_colour,
+                    )
                 )
 
                 lowest_y = min(lowest_y, chip_bottom)
                 current_x += chip_width + gap_x
 
+            chip_rects = tuple(
+                (fill_colour, tuple(chips))
+                for fill_colour, chips in chips_by_colour.items()
+            )
+            return line_height, chip_rects, tuple(labels), lowest_y
+
+        def draw_tag_chips(
+            tags: list[str],
+            *,
+            start_x: float,
+            start_y: float,
+            max_x: float,
+            font_name: str,
+            font_size: int = 10,
+        ) -> float:
+            """Render tag chips and return the next baseline y-position."""
+            if not tags:
+                return start_y
+
+            chip_layout = layout_tag_chips(
+                tuple(tags), font_name, font_size, max_x - start_x
+            )
+            if chip_layout is None:
+                return start_y
+            line_height, chip_rects, labels, lowest_y = chip_layout
+
+            radius = line_height / 2
+            for fill_colour, chips in chip_rects:
+                pdf_canvas.setFillColor(fill_colour)
+                path = pdf_canvas.beginPath()
+                for x, y, chip_width in chips:
+                    path.roundRect(
+                        start_x + x, start_y + y, chip_width, line_height, radius
+                    )
+                pdf_canvas.drawPath(path, stroke=0, fill=1)
+
+            text_object = pdf_canvas.beginText()
+            text_object.setFont(font_name, font_size)
+            current_text_colour = None
+            for x, y, label, text_colour in labels:
+                if text_colour is not current_text_colour:
+                    text_object.setFillColor(text_colour)
+                    current_text_colour = text_colour
+                text_object.setTextOrigin(start_x + x, start_y + y)
+                text_object.textOut(label)
+            pdf_canvas.drawText(text_object)
+
+            pdf_canvas.setFont(font_name, font_size)
             pdf_canvas.setFillColor(colors.black)
-            return lowest_y - 10
+            return start_y + lowest_y - 10
+
+        # Default and shared detail text is wrapped once per font and width
+        @lru_cache(maxsize=4096)
+        def wrap_text(
+            text: str, font_name: str, font_size: int, max_width: float
+        ) -> tuple[str, ...]:
+            return tuple(simpleSplit(text, font_name, font_size, max_width))
 
         self.__draw_on_canvas(pdf_canvas, fonts_map, body_font_name, heading_font_name)
 
         for task in detail_tasks:
-            for box_x, box_y, box_width, box_height in task.boxes:
-                if box_width <= 0 or box_height <= 0:
-                    continue
+            link_boxes = [box for box in task.boxes if box[2] > 0 and box[3] > 0]
+            for box_x, box_y, box_width, box_height in link_boxes:
                 rect = (
                     box_x,
                     self.height - (box_y + box_height),
@@ -1074,7 +1370,7 @@ class Roadmap:
 
             body_text = task.detail_body or "No additional detail supplied for this item."
             next_body_y = heading_y - 32
-            task_tags = list(getattr(task, "tags", []))
+            task_tags = task.tags
             if task_tags:
                 next_body_y = draw_tag_chips(
                     task_tags,
@@ -1088,7 +1384,7 @@ class Roadmap:
             text_object = pdf_canvas.beginText(40, next_body_y)
             text_object.setFont(body_font_name, 12)
             text_object.setLeading(16)
-            wrapped_lines = simpleSplit(body_text, body_font_name, 12, self.width - 80)
+            wrapped_lines = wrap_text(body_text, body_font_name, 12, self.width - 80)
             for line in wrapped_lines:
                 text_object.textLine(line)
             pdf_canvas.drawText(text_object)
@@ -1097,90 +1393,98 @@ class Roadmap:
             outline_start_y = current_y - 20
             nested_overview = nested_artifacts.get(task.identifier)
             if nested_overview and nested_overview.groups:
-                pdf_canvas.setFont(heading_font_name, 12)
                 pdf_canvas.setFillColor(colors.black)
-                pdf_canvas.drawString(40, outline_start_y, "Roadmap Tasks")
+                # The outline is written through one text object, which is only
+                # flushed where tag chips are drawn so reading order is kept
+                outline_text = pdf_canvas.beginText(40, outline_start_y)
+                outline_text.setFont(heading_font_name, 12)
+                outline_text.textOut("Roadmap Tasks")
                 outline_y = outline_start_y - 16
-                pdf_canvas.setFont(body_font_name, 11)
+                outline_text.setFont(body_font_name, 11)
                 text_width_limit = self.width - 80
 
+                def outline_line(x: float, y: float, text: str) -> None:
+                    outline_text.setTextOrigin(x, y)
+                    outline_text.textOut(text)
+
+                def outline_chips(
+                    tags: list[str], x: float, y: float, size: int
+                ) -> float:
+                    nonlocal outline_text
+                    pdf_canvas.drawText(outline_text)
+                    next_y = draw_tag_chips(
+                        tags,
+                        start_x=x,
+                        start_y=y,
+                        max_x=self.width - 40,
+                        font_name=body_font_name,
+                        font_size=size,
+                    )
+                    outline_text = pdf_canvas.beginText()
+                    outline_text.setFont(body_font_name, 11)
+                    return next_y
+
                 for group in nested_overview.groups:
-                    pdf_canvas.drawString(40, outline_y, f"{group.text}:")
+                    outline_line(40, outline_y, f"{group.text}:")
                     outline_y -= 14
                     for subtask in group.tasks:
-                        pdf_canvas.drawString(
+                        outline_line(
                             60,
                             outline_y,
                             f"- {subtask.text} ({subtask.start} to {subtask.end})",
                         )
                         outline_y -= 12
-                        subtask_tags = list(getattr(subtask, "tags", []))
-                        if subtask_tags:
-                            outline_y = draw_tag_chips(
-                                subtask_tags,
-                                start_x=70,
-                                start_y=outline_y,
-                                max_x=self.width - 40,
-                                font_name=body_font_name,
-                                font_size=9,
-                            )
-                            pdf_canvas.setFont(body_font_name, 11)
-                        if getattr(subtask, "detail_body", None):
-                            detail_lines = simpleSplit(
+                        if subtask.tags:
+                            outline_y = outline_chips(subtask.tags, 70, outline_y, 9)
+                        if subtask.detail_body:
+                            detail_lines = wrap_text(
                                 subtask.detail_body,
                                 body_font_name,
                                 10,
                                 text_width_limit - 60,
                             )
-                            pdf_canvas.setFont(body_font_name, 10)
+                            outline_text.setFont(body_font_name, 10)
                             for line in detail_lines:
-                                pdf_canvas.drawString(70, outline_y, line)
+                                outline_line(70, outline_y, line)
                                 outline_y -= 12
-                            pdf_canvas.setFont(body_font_name, 11)
+                            outline_text.setFont(body_font_name, 11)
                         if subtask.milestones:
-                            pdf_canvas.drawString(70, outline_y, "Milestones:")
+                            outline_line(70, outline_y, "Milestones:")
                             outline_y -= 12
                             for milestone in subtask.milestones:
-                                pdf_canvas.drawString(
+                                outline_line(
                                     80,
                                     outline_y,
                                     f"• {milestone.text} ({milestone.date})",
                                 )
                                 outline_y -= 12
                         for parallel_task in subtask.tasks:
-                            pdf_canvas.drawString(
+                            outline_line(
                                 70,
                                 outline_y,
                                 f"* {parallel_task.text} ({parallel_task.start} to {parallel_task.end})",
                             )
                             outline_y -= 12
-                            parallel_tags = list(getattr(parallel_task, "tags", []))
-                            if parallel_tags:
-                                outline_y = draw_tag_chips(
-                                    parallel_tags,
-                                    start_x=90,
-                                    start_y=outline_y,
-                                    max_x=self.width - 40,
-                                    font_name=body_font_name,
-                                    font_size=8,
+                            if parallel_task.tags:
+                                outline_y = outline_chips(
+                                    parallel_task.tags, 90, outline_y, 8
                                 )
-                                pdf_canvas.setFont(body_font_name, 11)
-                            if getattr(parallel_task, "detail_body", None):
-                                pdf_canvas.setFont(body_font_name, 10)
-                                for line in simpleSplit(
+                            if parallel_task.detail_body:
+                                outline_text.setFont(body_font_name, 10)
+                                for line in wrap_text(
                                     parallel_task.detail_body,
                                     body_font_name,
                                     10,
                                     text_width_limit - 80,
                                 ):
-                                    pdf_canvas.drawString(90, outline_y, line)
+                                    outline_line(90, outline_y, line)
                                     outline_y -= 12
-                                pdf_canvas.setFont(body_font_name, 11)
+                                outline_text.setFont(body_font_name, 11)
                             if parallel_task.milestones:
-                                pdf_canvas.drawString(90, outline_y, "Milestones:")
+                                outline_line(90, outline_y, "Milestones:")
                                 outline_y -= 12
                                 for milestone in parallel_task.milestones:
-                                    pdf_canvas.drawString(
+                                    outline_line(
                                         100,
                                         outline_y,
                                         f"• {milestone.text} ({milestone.date})",
@@ -1188,6 +1492,7 @@ class Roadmap:
                                     outline_y -= 12
                         outline_y -= 6
                     outline_y -= 8
+                pdf_canvas.drawText(outline_text)
                 current_y = outline_y
 
             if task.detail_links:
@@ -1198,9 +1503,9 @@ class Roadmap:
                 pdf_canvas.setFont(body_font_name, 11)
                 for label, url in task.detail_links:
                     label_text = label or url
-                    pdf_canvas.setFillColor(colors.HexColor("#1f77b4"))
+                    pdf_canvas.setFillColor(self.__hex_colour("#1f77b4"))
                     pdf_canvas.drawString(40, link_y, label_text)
-                    text_width = pdf_canvas.stringWidth(label_text, body_font_name, 11)
+                    text_width = string_width(label_text, body_font_name, 11)
                     pdf_canvas.linkURL(
                         url,
                         (40, link_y - 2, 40 + text_width, link_y + 12),
@@ -1237,14 +1542,55 @@ class Roadmap:
             if index < len(detail_tasks) - 1:
                 pdf_canvas.showPage()
 
+        def nested_ensure(font_name: str, font_files: dict[str, str]) -> str:
+            if not font_name:
+                return ensure_pdf_font("Helvetica", "")
+            return ensure_pdf_font(font_name, font_files.get(font_name, ""))
+
+        # Resolve the fonts of every nested roadmap in one pass up front
+        nested_fonts = {}
+        for identifier, nested_roadmap in nested_artifacts.items():
+            nested_fonts_map = nested_roadmap.__collect_font_names()
+            nested_font_files = nested_roadmap._font_files
+            nested_body_font = nested_ensure(
+                nested_roadmap._pdf_body_font, nested_font_files
+            )
+            nested_fonts_map["body"] = nested_body_font
+            nested_heading_font = nested_ensure(
+                nested_fonts_map.get("title", nested_body_font), nested_font_files
+            )
+            nested_fonts_map["title"] = nested_heading_font
+            for component in ("timeline", "group", "task", "milestone"):
+                nested_fonts_map[component] = nested_ensure(
+                    nested_fonts_map.get(component, nested_body_font),
+                    nested_font_files,
+                )
+            if nested_roadmap.marker is not None:
+                nested_fonts_map["marker"] = nested_ensure(
+                    nested_roadmap.marker.font, nested_font_files
+                )
+            else:
+                nested_fonts_map["marker"] = nested_fonts_map["timeline"]
+            nested_fonts[identifier] = (
+                nested_fonts_map,
+                nested_body_font,
+                nested_heading_font,
+            )
+
+        # Pages drawing each nested roadmap; a shared one is painted once
+        nested_uses: dict[int, int] = {}
+        for nested_roadmap in nested_artifacts.values():
+            key = id(nested_roadmap)
+            nested_uses[key] = nested_uses.get(key, 0) + 1
+        nested_forms: dict[int, str] = {}
         for task in detail_tasks:
             nested_roadmap = nested_artifacts.get(task.identifier)
             if nested_roadmap is None:
                 continue
             nested_dest = f"{task.identifier}_roadmap"
             pdf_canvas.showPage()
-            page_width = float(getattr(nested_roadmap, "width", self.width))
-            page_height = float(getattr(nested_roadmap, "height", self.height))
+            page_width = float(nested_roadmap.width)
+            page_height = float(nested_roadmap.height)
             pdf_canvas.setPageSize((page_width, page_height))
             pdf_canvas.bookmarkPage(nested_dest)
             pdf_canvas.addOutlineEntry(
@@ -1254,49 +1600,30 @@ class Roadmap:
                 closed=False,
             )
 
-            nested_fonts_map = nested_roadmap.__collect_font_names()
-            nested_font_files = getattr(nested_roadmap, "_font_files", {})
-
-            def nested_ensure(font_name: str) -> str:
-                if not font_name:
-                    return ensure_pdf_font("Helvetica", "")
-                file_path = nested_font_files.get(font_name, "")
-                return ensure_pdf_font(font_name, file_path)
+            nested_fonts_map, nested_body_font, nested_heading_font = nested_fonts[
+                task.identifier
+            ]
 
-            nested_body_font = nested_ensure(
-                getattr(
-                    nested_roadmap,
-                    "_pdf_body_font",
-                    nested_fonts_map.get("task", body_font_name),
-                )
-            )
-            nested_fonts_map["body"] = nested_body_font
-            nested_heading_font = nested_ensure(
-                nested_fonts_map.get("title", nested_body_font)
-            )
-            nested_fonts_map["title"] = nested_heading_font
-            nested_fonts_map["timeline"] = nested_ensure(
-                nested_fonts_map.get("timeline", nested_body_font)
-            )
-            nested_fonts_map["group"] = nested_ensure(
-                nested_fonts_map.get("group", nested_body_font)
-            )
-            nested_fonts_map["task"] = nested_ensure(
-                nested_fonts_map.get("task", nested_body_font)
-            )
-            nested_fonts_map["milestone"] = nested_ensure(
-                nested_fonts_map.get("milestone", nested_body_font)
-            )
-            if nested_roadmap.marker is not None:
-                nested_fonts_map["marker"] = nested_ensure(
-                    nested_roadmap.marker.font
+            # A form XObject only pays for itself when several pages show the
+            # same roadmap; a roadmap drawn once goes straight onto its page
+            if nested_uses[id(nested_roadmap)] == 1:
+                nested_roadmap.__draw_on_canvas(
+                    pdf_canvas, nested_fonts_map, nested_body_font, nested_heading_font
                 )
             else:
-                nested_fonts_map["marker"] = nested_fonts_map["timeline"]
-
-            nested_roadmap.__draw_on_canvas(
-                pdf_canvas, nested_fonts_map, nested_body_font, nested_heading_font
-            )
+                form_name = nested_forms.get(id(nested_roadmap))
+                if form_name is None:
+                    form_name = f"{nested_dest}_form"
+                    nested_forms[id(nested_roadmap)] = form_name
+                    pdf_canvas.beginForm(form_name)
+                    nested_roadmap.__draw_on_canvas(
+                        pdf_canvas,
+                        nested_fonts_map,
+                        nested_body_font,
+                        nested_heading_font,
+                    )
+                    pdf_canvas.endForm()
+                pdf_canvas.doForm(form_name)
             button_height = 28
             button_y = 40
             button_width = 180
@@ -1339,16 +1666,17 @@ class Roadmap:
         Args:
             print_area (str, optional): Roadmap area to print. Defaults to "all". Options are "all", "title", "timeline", "groups", "footer"
         """
-        dash = "─"
-        space = " "
+        # Every line is collected first and written to stdout in one call
+        lines = []
+        add_line = lines.append
         if print_area == "all" or print_area == "title":
-            print(f"Title={self.title.text}")
+            add_line(f"Title={self.title.text}")
 
         if print_area == "all" or print_area == "timeline":
-            print("Timeline:")
+            add_line("Timeline:")
             for timeline_item in self.timeline.timeline_items:
-                print(
-                    f"└{dash*8}{timeline_item.text}, value={timeline_item.value}, "
+                add_line(
+                    f"{_PRINT_BRANCH}{timeline_item.text}, value={timeline_item.value}, "
                     f"box_x={round(timeline_item.box_x,2)}, box_y={timeline_item.box_y}, "
                     f"box_w={round(timeline_item.box_width,2)}, box_h={timeline_item.box_height}, "
                     f"text_x={round(timeline_item.text_x,2)}, text_y={timeline_item.text_y}"
@@ -1356,39 +1684,42 @@ class Roadmap:
 
         if print_area == "all" or print_area == "groups":
             for group in self.groups:
-                print(
-                    f"Group: text={group.text}, x={round(group.box_x, 2)}, y={group.box_y},",
-                    f"w={group.box_width}, h={group.box_height}",
+                add_line(
+                    f"Group: text={group.text}, x={round(group.box_x, 2)}, y={group.box_y}, "
+                    f"w={group.box_width}, h={group.box_height}"
                 )
                 for task in group.tasks:
-                    print(
-                        f"└{dash*8}{task.text}, start={task.start}, end={task.end}, "
+                    add_line(
+                        f"{_PRINT_BRANCH}{task.text}, start={task.start}, end={task.end}, "
                         f"x={round(task.box_x, 2)}, y={task.box_y}, w={round(task.box_width, 2)}, "
                         f"h={task.box_height}"
                     )
                     for milestone in task.milestones:
-                        print(
-                            f"{space*9}├{dash*4}{milestone.text}, date={milestone.date}, x={round(milestone.diamond_x, 2)}, "
+                        add_line(
+                            f"{_PRINT_MILESTONE}{milestone.text}, date={milestone.date}, x={round(milestone.diamond_x, 2)}, "
                             f"y={milestone.diamond_y}, w={milestone.diamond_width}, h={milestone.diamond_height}, "
                             f"font_colour={milestone.font_colour}, fill_colour={milestone.fill_colour}"
                         )
                     for parellel_task in task.tasks:
-                        print(
-                            f"{space*9}└{dash*4}Parellel Task: {parellel_task.text}, start={parellel_task.start}, "
+                        add_line(
+                            f"{_PRINT_PARALLEL}Parellel Task: {parellel_task.text}, start={parellel_task.start}, "
                             f"end={parellel_task.end}, x={round(parellel_task.box_x,2)}, y={round(parellel_task.box_y, 2)}, "
                             f"w={round(parellel_task.box_width, 2)}, h={round(parellel_task.box_height,2)}"
                         )
                         for parellel_task_milestone in parellel_task.milestones:
-                            print(
-                                f"{space*14}├{dash*4}{parellel_task_milestone.text}, "
+                            add_line(
+                                f"{_PRINT_PARALLEL_MILESTONE}{parellel_task_milestone.text}, "
                                 f"date={parellel_task_milestone.date}, x={round(parellel_task_milestone.diamond_x, 2)}, "
                                 f"y={round(parellel_task_milestone.diamond_y, 2)}, w={parellel_task_milestone.diamond_width}, "
                                 f"h={parellel_task_milestone.diamond_height}"
                             )
         if print_area == "all" or print_area == "footer":
             if self.footer != None:
-                print(
+                add_line(
                     f"Footer: {self.footer.text} x={self.footer.x} "
                     f"y={self.footer.y} w={self.footer.width} "
                     f"h={self.footer.height}"
                 )
+        if lines:
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
@@ -100,7 +100,9 @@ class Timeline:
             timelineitem_x = self.x + (i * timelineitem_width)
             timelineitem_text = self.__get_timeline_item_text(i)
             timelineitem_value = self.__get_timeline_item_value(i)
-            timelineitem_start, timelineitem_end = self.__get_timeline_item_dates(i)
+            timelineitem_start, timelineitem_end = self.__get_timeline_item_dates(
+                i, timelineitem_value
+            )
 
             timelineitem = TimelineItem(
                 text=timelineitem_text,
@@ -211,19 +213,25 @@ class Timeline:
 
         return timeline_value
 
-    def __get_timeline_item_dates(self, index: int) -> tuple[datetime, datetime]:
+    def __get_timeline_item_dates(
+        self, index: int, timeline_value: str = ""
+    ) -> tuple[datetime, datetime]:
         """Get the start and end dates of the timeline item
 
         Args:
             index (int): Index of the timeline item
+            timeline_value (str, optional): Value of the timeline item if already
+                                            known. Defaults to "" (work it out).
 
         Returns:
             tuple[datetime, datetime]: Start and end dates of the timeline item
         """
         timeline_start_period = ""
         timeline_end_period = ""
+        if timeline_value == "" and self.mode != TimelineMode.MONTHLY:
+            timeline_value = self.__get_timeline_item_value(index)
         if self.mode == TimelineMode.WEEKLY:
-            timeline_period = self.__get_timeline_item_value(index)
+            timeline_period = timeline_value
             this_year = timeline_period[0:4]
             this_week = timeline_period[4:]
             # print(f"{timeline_period=}, this_year={this_year} this_week={this_week}")
@@ -243,13 +251,14 @@ class Timeline:
             )
             # print(f"{timeline_start_period=}, {timeline_end_period=}")
         elif self.mode == TimelineMode.MONTHLY:
-            this_month = (self.start + relativedelta(months=+index)).month
-            this_year = (self.start + relativedelta(months=+index)).year
+            this_date = self.start + relativedelta(months=+index)
+            this_month = this_date.month
+            this_year = this_date.year
             _, month_end_day = calendar.monthrange(this_year, this_month)
             timeline_start_period = datetime(this_year, this_month, 1)
             timeline_end_period = datetime(this_year, this_month, month_end_day)
         elif self.mode == TimelineMode.QUARTERLY:
-            timeline_period = self.__get_timeline_item_value(index)
+            timeline_period = timeline_value
             # print(f"timeline_period={timeline_period}")
             this_year = int(timeline_period[0:4])
             this_quarter = int(timeline_period[4:])
@@ -270,7 +279,7 @@ class Timeline:
                 this_year + 3 * this_quarter // 12, 3 * this_quarter % 12 + 1, 1
             ) + timedelta(days=-1)
         elif self.mode == TimelineMode.HALF_YEARLY:
-            timeline_period = self.__get_timeline_item_value(index)
+            timeline_period = timeline_value
             this_year = int(timeline_period[0:4])
             this_half = int(timeline_period[4:])
             if this_half == 1:  # First Half
@@ -280,7 +289,7 @@ class Timeline:
                 timeline_start_period = datetime(this_year, 7, 1)
                 timeline_end_period = datetime(this_year, 12, 31)
         elif self.mode == TimelineMode.YEARLY:
-            timeline_period = self.__get_timeline_item_value(index)
+            timeline_period = timeline_value
             timeline_start_period = datetime(int(timeline_period), 1, 1)
             timeline_end_period = datetime(int(timeline_period), 12, 31)
         return timeline_start_period, timeline_end_period
@@ -1,41 +1,176 @@
-from datetime import datetime
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Optional
 
 import yaml
 
+try:
+    # libyaml's C loader is several times faster; fall back when it is not built
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from roadmapper.roadmap import Roadmap
 from roadmapper.timelinemode import TimelineMode
 
 CONFIG_PATH = Path(__file__).with_name("roadmap_config.yaml")
+_CONFIG_DIR = CONFIG_PATH.parent
+
+
+# Resolved once, so a later change to XDG_CACHE_HOME (fontconfig registration
+# points it at the working directory) cannot redirect the cache into the tree
+_CONFIG_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "roadmapper"
+)
+
+
+def _config_cache_path(path: Path) -> Path:
+    digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+    return _CONFIG_CACHE_DIR / f"{digest}.json"
+
+
+def _to_json(value: Any) -> Any:
+    """Convert a parsed YAML value to JSON, tagging dates so they round-trip.
+
+    Raises:
+        TypeError: the value has no lossless JSON form (e.g. non-string keys).
+    """
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("config keys must be strings to be cached")
+        if len(value) == 1 and ("__date__" in value or "__datetime__" in value):
+            raise TypeError("config uses a reserved cache key")
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_json(item) for item in value]
+    # datetime is a subclass of date, so it is checked first
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    raise TypeError(f"cannot cache a {type(value).__name__} config value")
+
+
+def _from_json(obj: dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        if "__date__" in obj:
+            return date.fromisoformat(obj["__date__"])
+    return obj
+
+
+def read_yaml_config(
+    path: Path, stat: Optional[os.stat_result] = None
+) -> dict[str, Any]:
+    """Parse a YAML config, reusing a cached parse while the file is unchanged.
+
+    The cache only pays off across processes: it lets a fresh run of either
+    example script skip YAML parsing when the config has not changed. It is
+    stored as JSON in the user's cache directory, so a planted or corrupt cache
+    file can at worst yield a wrong config, never run code. Configs that JSON
+    cannot represent exactly are simply not cached.
+
+    Args:
+        path: YAML file to read.
+        stat: ``path.stat()`` result when the caller already has one.
+
+    Returns:
+        The parsed config.
+    """
+    if stat is None:
+        stat = path.stat()
+    mtime_ns, size = stat.st_mtime_ns, stat.st_size
+    cache_path = _config_cache_path(path)
+    try:
+        with cache_path.open("rb") as handle:
+            cached = json.load(handle, object_hook=_from_json)
+        if (
+            isinstance(cached, dict)
+            and cached.get("mtime_ns") == mtime_ns
+            and cached.get("size") == size
+            and "config" in cached
+        ):
+            return cached["config"]
+    except (OSError, ValueError):
+        # Missing, stale or truncated cache: fall back to parsing the YAML
+        pass
+
+    # Binary mode: the YAML reader detects and decodes UTF-8 itself
+    with path.open("rb") as handle:
+        config = yaml.load(handle, Loader=_SafeLoader)
+    try:
+        payload = json.dumps(
+            {"mtime_ns": mtime_ns, "size": size, "config": _to_json(config)}
+        )
+    except (TypeError, ValueError):
+        return config
+    temp_name = None
+    try:
+        _CONFIG_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Write then rename, so a concurrent reader never sees a partial file
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=_CONFIG_CACHE_DIR, suffix=".tmp", delete=False
+        ) as handle:
+            temp_name = handle.name
+            handle.write(payload)
+        os.replace(temp_name, cache_path)
+        temp_name = None
+    except OSError:
+        pass
+    finally:
+        if temp_name is not None:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+    return config
 
 
 def load_config(path: Path = CONFIG_PATH) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle)
+    """Load a config; every call returns a fresh dict the caller may modify."""
+    return read_yaml_config(path)
+
 
+_TIMELINE_MAPPING = {
+    "WEEKLY": TimelineMode.WEEKLY,
+    "MONTHLY": TimelineMode.MONTHLY,
+    "QUARTERLY": TimelineMode.QUARTERLY,
+    "HALF_YEARLY": TimelineMode.HALF_YEARLY,
+    "HALF_YEAR": TimelineMode.HALF_YEARLY,
+    "YEARLY": TimelineMode.YEARLY,
+    "ANNUAL": TimelineMode.YEARLY,
+}
 
+
+@lru_cache(maxsize=32)
 def timeline_mode_from_string(value: str) -> TimelineMode:
     lookup = value.upper().replace("-", "_")
-    mapping = {
-        "WEEKLY": TimelineMode.WEEKLY,
-        "MONTHLY": TimelineMode.MONTHLY,
-        "QUARTERLY": TimelineMode.QUARTERLY,
-        "HALF_YEARLY": TimelineMode.HALF_YEARLY,
-        "HALF_YEAR": TimelineMode.HALF_YEARLY,
-        "YEARLY": TimelineMode.YEARLY,
-        "ANNUAL": TimelineMode.YEARLY,
-    }
     try:
-        return mapping[lookup]
+        return _TIMELINE_MAPPING[lookup]
     except KeyError as exc:
         raise ValueError(f"Unsupported timeline mode '{value}'.") from exc
 
 
+@lru_cache(maxsize=1024)
+def _year_month(date_str: str) -> tuple[int, int]:
+    # Parsed with strptime rather than sliced so malformed dates still raise
+    parsed = datetime.strptime(date_str, "%Y-%m-%d")
+    return parsed.year, parsed.month
+
+
 def months_between(start_str: str, end_str: str) -> int:
-    start_dt = datetime.strptime(start_str, "%Y-%m-%d")
-    end_dt = datetime.strptime(end_str, "%Y-%m-%d")
-    months = (end_dt.year - start_dt.year) * 12 + (end_dt.month - start_dt.month) + 1
+    start_year, start_month = _year_month(start_str)
+    end_year, end_month = _year_month(end_str)
+    months = (end_year - start_year) * 12 + (end_month - start_month) + 1
     return max(months, 1)
 
 
@@ -44,71 +179,123 @@ def default_timeline_items(start: str, end: str, mode: TimelineMode) -> int:
     if mode == TimelineMode.QUARTERLY:
         return max(1, (months + 2) // 3)
     if mode == TimelineMode.WEEKLY:
-        weeks = max(1, round((months * 30) / 7))
+        # Nearest whole number of weeks in months * 30 days, in integer maths
+        weeks = max(1, (months * 30 + 3) // 7)
         return min(26, weeks)
     return max(3, min(months, 18))
 
 
+_TAG_SEQUENCE_TYPES = frozenset((list, tuple, set))
+
+
 def normalise_tag_list(value: Any) -> list[str]:
-    if isinstance(value, str):
-        return [value] if value else []
-    if isinstance(value, (list, tuple, set)):
-        return [str(item) for item in value if item]
-    return []
+    value_type = type(value)
+    if value_type is not str and value_type not in _TAG_SEQUENCE_TYPES:
+        # YAML yields exact types; only subclasses need the isinstance checks
+        if isinstance(value, str):
+            value, value_type = str(value), str
+        elif not isinstance(value, (list, tuple, set)):
+            return []
+    # Tags repeat across many tasks and are used as palette keys, so intern them
+    if value_type is str:
+        return [sys.intern(value)] if value else []
+    return [sys.intern(str(item)) for item in value if item]
 
 
 def resolved_task_tags(task_cfg: dict[str, Any], fallback: list[str]) -> list[str]:
     tags = normalise_tag_list(task_cfg.get("tags"))
     if tags:
         return tags
+    # Tasks copy the tags they are given, so the fallback can be passed through
+    if all(fallback):
+        return fallback
     return [tag for tag in fallback if tag]
 
 
-def apply_tag_styles(
-    roadmap: Roadmap,
-    base_cfg: Optional[dict[str, Any]],
-    override_cfg: Optional[dict[str, Any]] = None,
-) -> None:
+# Tag palette and default colour sequence
+TagStyles = tuple[dict[str, str], Optional[list[str]]]
+
+
+def tag_style_settings(config: Optional[dict[str, Any]]) -> TagStyles:
+    if not config:
+        return {}, None
     palette: dict[str, str] = {}
     defaults: Optional[list[str]] = None
-
-    def extract(config: Optional[dict[str, Any]]) -> None:
-        nonlocal palette, defaults
-        if not config:
-            return
-        tag_cfg = config.get("tags")
-        if not isinstance(tag_cfg, dict):
-            return
+    tag_cfg = config.get("tags")
+    if isinstance(tag_cfg, dict):
         palette_cfg = tag_cfg.get("palette")
         if isinstance(palette_cfg, dict):
-            palette.update(
-                {
-                    str(tag): str(colour)
-                    for tag, colour in palette_cfg.items()
-                    if tag and colour
-                }
-            )
+            palette = {
+                str(tag): str(colour)
+                for tag, colour in palette_cfg.items()
+                if tag and colour
+            }
         default_cfg = tag_cfg.get("defaults")
         if isinstance(default_cfg, (list, tuple)) and default_cfg:
             defaults = [str(colour) for colour in default_cfg if colour]
+    return palette, defaults
+
+
+def merge_tag_styles(
+    base_styles: TagStyles, override_cfg: Optional[dict[str, Any]] = None
+) -> TagStyles:
+    palette, defaults = base_styles
+    override_palette, override_defaults = tag_style_settings(override_cfg)
+    if override_palette:
+        palette = {**palette, **override_palette}
+    if override_defaults is not None:
+        defaults = override_defaults
+    return palette, defaults
 
-    extract(base_cfg)
-    extract(override_cfg)
+
+def apply_tag_styles(
+    roadmap: Roadmap,
+    base_styles: TagStyles,
+    override_cfg: Optional[dict[str, Any]] = None,
+) -> None:
+    palette, defaults = merge_tag_styles(base_styles, override_cfg)
     roadmap.set_tag_styles(palette or None, defaults)
 
 
+def apply_header(
+    roadmap: Roadmap,
+    header_cfg: dict[str, Any],
+    title: str,
+    subtitle: Optional[str],
+) -> None:
+    roadmap.set_header(
+        logo_path=str(resolve_path(header_cfg.get("logo"))),
+        logo_width=header_cfg.get("logo_width", 80),
+        logo_height=header_cfg.get("logo_height", 80),
+        background_colour=header_cfg.get("background", "#FFFFFF"),
+        divider_colour=header_cfg.get("divider", "#CCCCCC"),
+        padding_x=header_cfg.get("padding_x", 24),
+        padding_y=header_cfg.get("padding_y", 18),
+        logo_spacing=header_cfg.get("logo_spacing", 16),
+        title=title,
+        subtitle=subtitle,
+    )
+
+
+# Shared by every generated detail body; only the lines above it vary per task
+_DEFAULT_DETAIL_QUESTIONS = (
+    "Key alignment questions:\n"
+    "- What success signals prove completion?\n"
+    "- Which dependencies must land early?\n"
+    "- Who owns stakeholder updates?"
+)
+
+
 def build_default_detail_text(task_cfg: dict[str, Any], area_name: str) -> str:
-    milestone = next(iter(task_cfg.get("milestones", [])), None)
+    milestones = task_cfg.get("milestones")
+    milestone = milestones[0] if milestones else None
     milestone_name = milestone["name"] if milestone else "Milestone"
     milestone_date = milestone["date"] if milestone else task_cfg["end"]
     return (
         f"{task_cfg['name']} anchors the {area_name} workstream.\n"
         f"Window: {task_cfg['start']} -> {task_cfg['end']}\n"
         f"Milestone target: {milestone_name} ({milestone_date}).\n\n"
-        "Key alignment questions:\n"
-        "- What success signals prove completion?\n"
-        "- Which dependencies must land early?\n"
-        "- Who owns stakeholder updates?"
+        f"{_DEFAULT_DETAIL_QUESTIONS}"
     )
 
 
@@ -117,6 +304,9 @@ def apply_fonts(
     base_fonts: Optional[dict[str, Any]],
     override_fonts: Optional[dict[str, Any]] = None,
 ) -> None:
+    if not base_fonts and not override_fonts:
+        return
+
     def parse_font_entry(entry: Any) -> tuple[str, Optional[str]]:
         if isinstance(entry, dict):
             return entry.get("name", ""), entry.get("file")
@@ -131,7 +321,7 @@ def apply_fonts(
     family_entry = base_fonts.get("family")
     family, family_file = parse_font_entry(family_entry)
     if family_file:
-        font_files[family] = str(resolve_path(family_file))
+        font_files[family] = resolve_font_file(family_file)
 
     components_cfg = base_fonts.get("components", {}) or {}
     for component, entry in components_cfg.items():
@@ -139,7 +329,7 @@ def apply_fonts(
         if font_name:
             component_fonts[component] = font_name
         if font_name and font_file:
-            font_files[font_name] = str(resolve_path(font_file))
+            font_files[font_name] = resolve_font_file(font_file)
 
     pdf_options: dict[str, Any] = {}
     if base_fonts.get("pdf"):
@@ -155,7 +345,7 @@ def apply_fonts(
             if override_family:
                 family = override_family
             if override_family and override_file:
-                font_files[override_family] = str(resolve_path(override_file))
+                font_files[override_family] = resolve_font_file(override_file)
 
         component_override = override_fonts.get("components") or {}
         for component, entry in component_override.items():
@@ -163,7 +353,7 @@ def apply_fonts(
             if font_name:
                 component_fonts[component] = font_name
             if font_name and font_file:
-                font_files[font_name] = str(resolve_path(font_file))
+                font_files[font_name] = resolve_font_file(font_file)
 
         override_pdf = override_fonts.get("pdf")
         if override_pdf:
@@ -175,7 +365,7 @@ def apply_fonts(
     pdf_name = pdf_options.get("name", family)
     pdf_file = pdf_options.get("file")
     if pdf_file:
-        pdf_file = str(resolve_path(pdf_file))
+        pdf_file = resolve_font_file(pdf_file)
 
     if not family and not component_fonts and not pdf_name and not pdf_file:
         return
@@ -189,76 +379,89 @@ def apply_fonts(
     )
 
 
+# Fonts and logos are resolved again by every nested roadmap builder
+@lru_cache(maxsize=256)
 def resolve_path(value: Optional[str]) -> Optional[Path]:
     if not value:
         return None
     path = Path(value)
     if not path.is_absolute():
-        path = (CONFIG_PATH.parent / path).resolve()
+        path = (_CONFIG_DIR / path).resolve()
     return path
 
 
+# Components, overrides and the PDF font often name the same font file
+@lru_cache(maxsize=256)
+def resolve_font_file(value: str) -> str:
+    return str(resolve_path(value))
+
+
 def create_detail_roadmap_builder(
     root_config: dict[str, Any],
     area_cfg: dict[str, Any],
     task_cfg: dict[str, Any],
     roadmap_cfg: dict[str, Any],
+    base_tag_styles: Optional[TagStyles] = None,
 ) -> Callable[[], Roadmap]:
-    def builder() -> Roadmap:
-        nested = Roadmap(
-            roadmap_cfg.get("width", root_config.get("width", 1400)),
-            roadmap_cfg.get("height", root_config.get("height", 750)),
-            colour_theme=roadmap_cfg.get(
-                "colour_theme", root_config.get("colour_theme", "DEFAULT")
-            ),
+    # Everything derived from the config alone is worked out once here;
+    # builder() only has to construct and populate the roadmap
+    width = roadmap_cfg.get("width", root_config.get("width", 1400))
+    height = roadmap_cfg.get("height", root_config.get("height", 750))
+    colour_theme = roadmap_cfg.get(
+        "colour_theme", root_config.get("colour_theme", "DEFAULT")
+    )
+
+    header_cfg = roadmap_cfg.get("header")
+    nested_title = roadmap_cfg.get("title", f"{task_cfg['name']} Detailed Roadmap")
+    nested_subtitle = roadmap_cfg.get("subtitle", area_cfg.get("name"))
+    if header_cfg:
+        nested_title = header_cfg.get("title", nested_title)
+        nested_subtitle = header_cfg.get("subtitle", nested_subtitle)
+
+    timeline_cfg = roadmap_cfg.get("timeline", {})
+    timeline_mode = timeline_mode_from_string(
+        timeline_cfg.get(
+            "mode",
+            root_config.get("timeline", {}).get("mode", "MONTHLY"),
+        )
+    )
+    timeline_start = timeline_cfg.get("start", task_cfg["start"])
+    timeline_items = timeline_cfg.get("items")
+    if timeline_items is None:
+        timeline_items = default_timeline_items(
+            task_cfg["start"], task_cfg["end"], timeline_mode
         )
+    timeline_items = int(timeline_items)
+    footer_text = roadmap_cfg.get("footer", root_config.get("footer"))
+    if base_tag_styles is None:
+        base_tag_styles = tag_style_settings(root_config)
+    tag_palette, tag_defaults = merge_tag_styles(base_tag_styles, roadmap_cfg)
+
+    def builder() -> Roadmap:
+        nested = Roadmap(width, height, colour_theme=colour_theme)
         apply_fonts(nested, root_config.get("fonts"), roadmap_cfg.get("fonts"))
-        apply_tag_styles(nested, root_config, roadmap_cfg)
+        nested.set_tag_styles(tag_palette or None, tag_defaults)
 
-        header_cfg = roadmap_cfg.get("header")
-        nested_title = roadmap_cfg.get("title", f"{task_cfg['name']} Detailed Roadmap")
-        nested_subtitle = roadmap_cfg.get("subtitle", area_cfg.get("name"))
         if header_cfg:
-            nested.set_header(
-                logo_path=str(resolve_path(header_cfg.get("logo"))),
-                logo_width=header_cfg.get("logo_width", 80),
-                logo_height=header_cfg.get("logo_height", 80),
-                background_colour=header_cfg.get("background", "#FFFFFF"),
-                divider_colour=header_cfg.get("divider", "#CCCCCC"),
-                padding_x=header_cfg.get("padding_x", 24),
-                padding_y=header_cfg.get("padding_y", 18),
-                logo_spacing=header_cfg.get("logo_spacing", 16),
-                title=header_cfg.get("title", nested_title),
-                subtitle=header_cfg.get("subtitle", nested_subtitle),
+            apply_header(
+                nested, header_cfg, title=nested_title, subtitle=nested_subtitle
             )
         else:
             nested.set_title(nested_title)
             if nested_subtitle:
                 nested.set_subtitle(nested_subtitle)
 
-        timeline_cfg = roadmap_cfg.get("timeline", {})
-        timeline_mode = timeline_mode_from_string(
-            timeline_cfg.get(
-                "mode",
-                root_config.get("timeline", {}).get("mode", "MONTHLY"),
-            )
-        )
-        timeline_start = timeline_cfg.get("start", task_cfg["start"])
-        timeline_items = timeline_cfg.get("items")
-        if timeline_items is None:
-            timeline_items = default_timeline_items(
-                task_cfg["start"], task_cfg["end"], timeline_mode
-            )
         nested.set_timeline(
             timeline_mode,
             start=timeline_start,
-            number_of_items=int(timeline_items),
+            number_of_items=timeline_items,
         )
 
         for group_cfg in roadmap_cfg.get("groups", []):
             nested_group = nested.add_group(group_cfg.get("name", "Workstream"))
+            add_task = nested_group.add_task
             for nested_task_cfg in group_cfg.get("tasks", []):
-                nested_task = nested_group.add_task(
+                nested_task = add_task(
                     nested_task_cfg["name"],
                     nested_task_cfg["start"],
                     nested_task_cfg["end"],
@@ -266,8 +469,9 @@ def create_detail_roadmap_builder(
                         nested_task_cfg, [nested_group.text]
                     ),
                 )
+                add_milestone = nested_task.add_milestone
                 for milestone_cfg in nested_task_cfg.get("milestones", []):
-                    nested_task.add_milestone(
+                    add_milestone(
                         milestone_cfg["name"],
                         milestone_cfg["date"],
                     )
@@ -288,7 +492,6 @@ def create_detail_roadmap_builder(
                 elif nested_task_cfg.get("detail"):
                     nested_task.set_detail(str(nested_task_cfg["detail"]))
 
-        footer_text = roadmap_cfg.get("footer", root_config.get("footer"))
         if footer_text:
             nested.set_footer(footer_text)
 
@@ -309,36 +512,25 @@ def build_roadmap_from_definition(
     )
 
     apply_fonts(roadmap, root_config.get("fonts"), definition.get("fonts"))
-    apply_tag_styles(roadmap, root_config, definition)
+    base_tag_styles = tag_style_settings(root_config)
+    apply_tag_styles(roadmap, base_tag_styles, definition)
 
     title_text = definition.get("title", root_config.get("title", "Roadmap"))
     subtitle_text = definition.get("subtitle", root_config.get("subtitle"))
     header_cfg = definition.get("header")
     if header_cfg:
-        roadmap.set_header(
-            logo_path=str(resolve_path(header_cfg.get("logo"))),
-            logo_width=header_cfg.get("logo_width", 80),
-            logo_height=header_cfg.get("logo_height", 80),
-            background_colour=header_cfg.get("background", "#FFFFFF"),
-            divider_colour=header_cfg.get("divider", "#CCCCCC"),
-            padding_x=header_cfg.get("padding_x", 24),
-            padding_y=header_cfg.get("padding_y", 18),
-            logo_spacing=header_cfg.get("logo_spacing", 16),
+        apply_header(
+            roadmap,
+            header_cfg,
             title=header_cfg.get("title", title_text),
             subtitle=header_cfg.get("subtitle", subtitle_text),
         )
     else:
         fallback_header = root_config.get("header")
         if fallback_header:
-            roadmap.set_header(
-                logo_path=str(resolve_path(fallback_header.get("logo"))),
-                logo_width=fallback_header.get("logo_width", 80),
-                logo_height=fallback_header.get("logo_height", 80),
-                background_colour=fallback_header.get("background", "#FFFFFF"),
-                divider_colour=fallback_header.get("divider", "#CCCCCC"),
-                padding_x=fallback_header.get("padding_x", 24),
-                padding_y=fallback_header.get("padding_y", 18),
-                logo_spacing=fallback_header.get("logo_spacing", 16),
+            apply_header(
+                roadmap,
+                fallback_header,
                 title=title_text,
                 subtitle=subtitle_text,
             )
@@ -365,21 +557,23 @@ def build_roadmap_from_definition(
     )
 
     for area_cfg in definition.get("areas", []):
-        group = roadmap.add_group(area_cfg["name"])
+        area_name = area_cfg["name"]
+        add_task = roadmap.add_group(area_name).add_task
         for task_cfg in area_cfg.get("tasks", []):
-            task = group.add_task(
+            task = add_task(
                 task_cfg["name"],
                 task_cfg["start"],
                 task_cfg["end"],
-                tags=resolved_task_tags(task_cfg, [group.text]),
+                tags=resolved_task_tags(task_cfg, [area_name]),
             )
+            add_milestone = task.add_milestone
             for milestone_cfg in task_cfg.get("milestones", []):
-                task.add_milestone(milestone_cfg["name"], milestone_cfg["date"])
+                add_milestone(milestone_cfg["name"], milestone_cfg["date"])
 
             detail_cfg = task_cfg.get("detail", {})
             if isinstance(detail_cfg, dict):
                 detail_text = detail_cfg.get("description") or build_default_detail_text(
-                    task_cfg, area_cfg["name"]
+                    task_cfg, area_name
                 )
                 detail_title = detail_cfg.get("title")
                 task.set_detail(detail_text, title=detail_title)
@@ -396,12 +590,13 @@ def build_roadmap_from_definition(
                             area_cfg,
                             task_cfg,
                             roadmap_cfg,
+                            base_tag_styles,
                         )
                     )
             elif detail_cfg:
                 task.set_detail(str(detail_cfg))
             else:
-                task.set_detail(build_default_detail_text(task_cfg, area_cfg["name"]))
+                task.set_detail(build_default_detail_text(task_cfg, area_name))
 
     footer = definition.get("footer", root_config.get("footer"))
     if footer:
@@ -417,21 +612,16 @@ def build_primary_roadmap(config: dict[str, Any]) -> Roadmap:
     )
 
     apply_fonts(roadmap, config.get("fonts"))
-    apply_tag_styles(roadmap, config)
+    base_tag_styles = tag_style_settings(config)
+    apply_tag_styles(roadmap, base_tag_styles)
 
     header_cfg = config.get("header")
     title_text = config.get("title", "Roadmap Overview")
     subtitle_text = config.get("subtitle")
     if header_cfg:
-        roadmap.set_header(
-            logo_path=str(resolve_path(header_cfg.get("logo"))),
-            logo_width=header_cfg.get("logo_width", 80),
-            logo_height=header_cfg.get("logo_height", 80),
-            background_colour=header_cfg.get("background", "#FFFFFF"),
-            divider_colour=header_cfg.get("divider", "#CCCCCC"),
-            padding_x=header_cfg.get("padding_x", 24),
-            padding_y=header_cfg.get("padding_y", 18),
-            logo_spacing=header_cfg.get("logo_spacing", 16),
+        apply_header(
+            roadmap,
+            header_cfg,
             title=header_cfg.get("title", title_text),
             subtitle=header_cfg.get("subtitle", subtitle_text),
         )
@@ -450,20 +640,22 @@ def build_primary_roadmap(config: dict[str, Any]) -> Roadmap:
     )
 
     for area_cfg in config.get("areas", []):
-        group = roadmap.add_group(area_cfg["name"])
+        area_name = area_cfg["name"]
+        add_task = roadmap.add_group(area_name).add_task
         for task_cfg in area_cfg.get("tasks", []):
-            task = group.add_task(
+            task = add_task(
                 task_cfg["name"],
                 task_cfg["start"],
                 task_cfg["end"],
-                tags=resolved_task_tags(task_cfg, [group.text]),
+                tags=resolved_task_tags(task_cfg, [area_name]),
             )
+            add_milestone = task.add_milestone
             for milestone_cfg in task_cfg.get("milestones", []):
-                task.add_milestone(milestone_cfg["name"], milestone_cfg["date"])
+                add_milestone(milestone_cfg["name"], milestone_cfg["date"])
 
             detail_cfg = task_cfg.get("detail", {})
             detail_text = detail_cfg.get("description") or build_default_detail_text(
-                task_cfg, area_cfg["name"]
+                task_cfg, area_name
             )
             detail_title = detail_cfg.get("title")
             task.set_detail(detail_text, title=detail_title)
@@ -482,6 +674,7 @@ def build_primary_roadmap(config: dict[str, Any]) -> Roadmap:
                         area_cfg,
                         task_cfg,
                         roadmap_cfg,
+                        base_tag_styles,
                     )
                 )
 